@@ -5,7 +5,7 @@ from typing import Any
 
 import structlog
 
-from src.tools import YFinanceTool
+from src.tools import get_yfinance_tool
 
 logger = structlog.get_logger()
 
@@ -33,7 +33,7 @@ class MarketDataAgent:
 
     def __init__(self) -> None:
         """Initialize market data agent."""
-        self._yfinance = YFinanceTool()
+        self._yfinance = get_yfinance_tool()
 
     def _format_price(self, price: float | None) -> str:
         """Format price for display."""
@@ -5,7 +5,7 @@ from typing import Any
 
 import structlog
 
-from src.tools import DuckDuckGoSearchTool
+from src.tools import get_search_tool
 
 logger = structlog.get_logger()
 
@@ -32,7 +32,7 @@ class NewsSentimentAgent:
 
     def __init__(self) -> None:
         """Initialize news sentiment agent."""
-        self._search_tool = DuckDuckGoSearchTool()
+        self._search_tool = get_search_tool()
 
     def analyze(
         self,
@@ -1,5 +1,6 @@
 """FastAPI application for Equity Research Agent."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -196,7 +197,7 @@ async def get_quote(request: Request, ticker: str) -> QuoteResponse:
     """
     import time
 
-    from src.tools import YFinanceTool
+    from src.tools import get_yfinance_tool
 
     start_time = time.time()
     ticker = ticker.upper()
@@ -205,7 +206,7 @@ async def get_quote(request: Request, ticker: str) -> QuoteResponse:
         raise HTTPException(status_code=400, detail="Invalid ticker format")
 
     try:
-        tool = YFinanceTool()
+        tool = get_yfinance_tool()
         quote = tool.get_quote(ticker)
 
         duration = time.time() - start_time
@@ -242,10 +243,13 @@ async def get_quote(request: Request, ticker: str) -> QuoteResponse:
 async def compare_stocks(request: Request, tickers: str) -> dict[str, Any]:
     """Compare P/E ratios for multiple stocks.
 
+    Quotes are fetched concurrently; a failed ticker is reported in ``errors``
+    instead of failing the whole comparison.
+
     Args:
         tickers: Comma-separated ticker symbols (e.g., "NVDA,AMD,INTC")
     """
-    from src.tools import YFinanceTool
+    from src.tools import get_yfinance_tool
 
     ticker_list = [t.strip().upper() for t in tickers.split(",")]
 
@@ -253,12 +257,37 @@ async def compare_stocks(request: Request, tickers: str) -> dict[str, Any]:
         raise HTTPException(status_code=400, detail="Maximum 5 tickers allowed")
 
     try:
-        tool = YFinanceTool()
-        comparison = tool.compare_pe_ratios(ticker_list)
+        tool = get_yfinance_tool()
+        # yfinance is blocking; get_quotes fans out over its own thread pool
+        quotes = await asyncio.to_thread(tool.get_quotes, ticker_list)
+
+        comparison: dict[str, float | None] = {}
+        comparisons: list[dict[str, Any]] = []
+        errors: list[str] = []
+        for ticker, quote in quotes.items():
+            if isinstance(quote, Exception):
+                logger.warning("comparison_quote_failed", ticker=ticker, error=str(quote))
+                comparison[ticker] = None
+                error = str(quote) if not settings.is_production else "fetch failed"
+                errors.append(f"{ticker}: {error}")
+                continue
+            comparison[ticker] = quote.pe_ratio if quote else None
+            if quote:
+                comparisons.append(
+                    {
+                        "ticker": ticker,
+                        "price": quote.price,
+                        "pe_ratio": quote.pe_ratio,
+                        "change_percent": quote.change_percent,
+                        "market_cap": quote.market_cap,
+                    }
+                )
 
         return {
             "success": True,
             "comparison": comparison,
+            "comparisons": comparisons,
+            "errors": errors,
         }
 
     except Exception as e:
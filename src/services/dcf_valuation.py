@@ -40,9 +40,9 @@ class DCFValuationService:
     def _get_yf(self):
         """Lazy load yfinance."""
         if self._yf_tool is None:
-            from src.tools.yfinance_tool import YFinanceTool
+            from src.tools.yfinance_tool import get_yfinance_tool
 
-            self._yf_tool = YFinanceTool()
+            self._yf_tool = get_yfinance_tool()
         return self._yf_tool
 
     def calculate_dcf(
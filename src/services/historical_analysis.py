@@ -94,6 +94,10 @@ class HistoricalAnalysisService:
             positive = 0
             negative = 0
 
+            # Resolve the trading dates and closes once, not per earnings date
+            hist_dates = hist.index.date
+            closes = hist["Close"].to_numpy()
+
             # Analyze each earnings date
             for _, row in earnings_hist.head(num_quarters).iterrows():
                 try:
@@ -110,14 +114,14 @@ class HistoricalAnalysisService:
                     ed + timedelta(days=1)
 
                     # Get closest prices
-                    before_mask = hist.index.date <= ed
-                    after_mask = hist.index.date >= ed
+                    before_mask = hist_dates <= ed
+                    after_mask = hist_dates >= ed
 
                     if not before_mask.any() or not after_mask.any():
                         continue
 
-                    price_before = hist[before_mask]["Close"].iloc[-1]
-                    price_after = hist[after_mask]["Close"].iloc[0]
+                    price_before = closes[before_mask][-1]
+                    price_after = closes[after_mask][0]
 
                     # Calculate change
                     change = ((price_after - price_before) / price_before) * 100
@@ -85,9 +85,9 @@ class PeerComparisonService:
     def _get_yfinance_tool(self):
         """Lazy load yfinance tool."""
         if self._yfinance_tool is None:
-            from src.tools.yfinance_tool import YFinanceTool
+            from src.tools.yfinance_tool import get_yfinance_tool
 
-            self._yfinance_tool = YFinanceTool()
+            self._yfinance_tool = get_yfinance_tool()
         return self._yfinance_tool
 
     def get_peers(self, ticker: str) -> list[str]:
@@ -258,14 +258,14 @@ class RiskScoringService:
         from langchain_groq import ChatGroq
 
         from src.config.settings import get_settings
-        from src.tools.yfinance_tool import YFinanceTool
+        from src.tools.yfinance_tool import get_yfinance_tool
 
         settings = get_settings()
         ticker = ticker.upper()
 
         # Get basic company info for context
         try:
-            yf_tool = YFinanceTool()
+            yf_tool = get_yfinance_tool()
             quote = yf_tool.get_quote(ticker)
             _ = yf_tool.get_financials(ticker)  # noqa: F841
             company_name = quote.name if quote else ticker
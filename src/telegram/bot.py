@@ -37,6 +37,7 @@ from src.telegram.handlers_v2 import (
     set_api_client_v2,
     watchlist_command,
 )
+from src.telegram.storage import get_storage
 
 # Configure logging
 logging.basicConfig(
@@ -71,8 +72,13 @@ def create_application(token: str, api_base_url: str | None = None) -> Applicati
     set_api_client(client)
     set_api_client_v2(client)
 
+    async def shutdown(_: Application) -> None:  # type: ignore[type-arg]
+        """Release pooled API connections and flush user preferences."""
+        await client.close()
+        get_storage().close()
+
     # Build application
-    application = Application.builder().token(token).build()
+    application = Application.builder().token(token).post_shutdown(shutdown).build()
 
     # Command handlers - Core
     application.add_handler(CommandHandler("start", start_command))
@@ -1,12 +1,15 @@
 """HTTP client to communicate with the Equity Research API."""
 
+from dataclasses import dataclass
+
 import httpx
-from pydantic import BaseModel
+import orjson
 
 from src.config.settings import get_settings
 
 
-class QuoteResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class QuoteResponse:
     """Stock quote response."""
 
     ticker: str
@@ -18,7 +21,8 @@ class QuoteResponse(BaseModel):
     error: str | None = None
 
 
-class CompareResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CompareResponse:
     """Comparison response."""
 
     tickers: list[str]
@@ -26,7 +30,8 @@ class CompareResponse(BaseModel):
     error: str | None = None
 
 
-class AnalyzeResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class AnalyzeResponse:
     """Analysis response."""
 
     query: str
@@ -52,7 +57,17 @@ class APIClient:
         if settings.api_secret_key:
             headers["X-API-Key"] = settings.api_secret_key.get_secret_value()
 
-        self.client = httpx.AsyncClient(timeout=120.0, headers=headers)
+        # One pooled client for the bot's lifetime so commands reuse keep-alive connections
+        transport = httpx.AsyncHTTPTransport(
+            retries=2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        # No base_url: the handlers also call self.client with absolute URLs
+        self.client = httpx.AsyncClient(
+            timeout=120.0,
+            headers=headers,
+            transport=transport,
+        )
 
     async def health_check(self) -> bool:
         """Check if the API is healthy."""
@@ -74,7 +89,7 @@ class APIClient:
         try:
             response = await self.client.get(f"{self.base_url}/quote/{ticker.upper()}")
             if response.status_code == 200:
-                json_data = response.json()
+                json_data = orjson.loads(response.content)
                 # API returns {"success": true, "data": {...}, "error": null}
                 if json_data.get("success") and json_data.get("data"):
                     data = json_data["data"]
@@ -107,7 +122,7 @@ class APIClient:
             tickers_str = ",".join(t.upper() for t in tickers)
             response = await self.client.get(f"{self.base_url}/compare/{tickers_str}")
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return CompareResponse(tickers=tickers, data=data.get("comparisons", []))
             return CompareResponse(tickers=tickers, error=f"API error: {response.status_code}")
         except httpx.RequestError as e:
@@ -133,7 +148,7 @@ class APIClient:
                 json=payload,
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 report_data = data.get("report")
 
                 # Handle both dict (new format) and string (legacy) report
@@ -1,7 +1,47 @@
 """Format API responses for Telegram messages."""
 
+import math
+
 from src.telegram.client import AnalyzeResponse, CompareResponse, QuoteResponse
 
+# Suffix per power of 1000 (None means the value is shown unscaled)
+_MARKET_CAP_SUFFIXES = (None, None, "M", "B", "T")
+_VOLUME_SUFFIXES = (None, "K", "M")
+
+# Telegram has a 4096 char limit; leave room for the header and sources
+MAX_REPORT_LENGTH = 3800
+_TRUNCATED_SUFFIX = "\n\n_[Report truncated...]_"
+
+# Trend emoji keyed by the sign of the change
+_CHANGE_EMOJI = {1: "📈", -1: "📉", 0: "➖"}
+
+# One block per ticker in format_compare
+_COMPARE_ROW = "*{ticker}* {emoji}\n  Price: {price} ({change})\n  P/E: {pe}\n"
+
+
+def _change_emoji(change: float) -> str:
+    """Get the trend emoji for a price change."""
+    return _CHANGE_EMOJI[(change > 0) - (change < 0)]
+
+
+def _format_scaled(value: float, suffixes: tuple[str | None, ...], precision: int) -> str | None:
+    """Format a value with its magnitude suffix (e.g. "2.30T").
+
+    Returns:
+        Scaled string, or None if the value is too small for a suffix or not finite.
+    """
+    if not math.isfinite(value) or value < 1:
+        return None
+    exponent = int(math.log10(value)) // 3
+    # log10 rounds up to the next integer just below a power of 1000
+    if value < 1000**exponent:
+        exponent -= 1
+    exponent = min(exponent, len(suffixes) - 1)
+    suffix = suffixes[exponent]
+    if suffix is None:
+        return None
+    return f"{value / 1000**exponent:.{precision}f}{suffix}"
+
 
 def format_quote(response: QuoteResponse) -> str:
     """Format a stock quote for Telegram.
@@ -15,50 +55,47 @@ def format_quote(response: QuoteResponse) -> str:
     if response.error:
         return f"*{response.ticker}*\n\nError: {response.error}"
 
-    # Format price change with emoji
     change = response.change_percent or 0
-    change_emoji = "📈" if change > 0 else "📉" if change < 0 else "➖"
-    change_str = f"{change:+.2f}%" if change else "N/A"
-
-    # Format market cap
     market_cap = response.market_cap
+    volume = response.volume
+
+    change_str = f"{change:+.2f}%" if change else "N/A"
     if market_cap:
-        if market_cap >= 1e12:
-            mc_str = f"${market_cap / 1e12:.2f}T"
-        elif market_cap >= 1e9:
-            mc_str = f"${market_cap / 1e9:.2f}B"
-        elif market_cap >= 1e6:
-            mc_str = f"${market_cap / 1e6:.2f}M"
-        else:
-            mc_str = f"${market_cap:,.0f}"
+        mc_str = "$" + (_format_scaled(market_cap, _MARKET_CAP_SUFFIXES, 2) or f"{market_cap:,.0f}")
     else:
         mc_str = "N/A"
-
-    # Format P/E
     pe_str = f"{response.pe_ratio:.2f}" if response.pe_ratio else "N/A"
-
-    # Format volume
-    volume = response.volume
     if volume:
-        if volume >= 1e6:
-            vol_str = f"{volume / 1e6:.1f}M"
-        elif volume >= 1e3:
-            vol_str = f"{volume / 1e3:.1f}K"
-        else:
-            vol_str = f"{volume:,}"
+        vol_str = _format_scaled(volume, _VOLUME_SUFFIXES, 1) or f"{volume:,}"
     else:
         vol_str = "N/A"
-
-    # Format price
     price_str = f"${response.price:.2f}" if response.price else "N/A"
 
-    return f"""*{response.ticker}* {change_emoji}
-
-*Price:* {price_str}
-*Change:* {change_str}
-*Market Cap:* {mc_str}
-*P/E Ratio:* {pe_str}
-*Volume:* {vol_str}"""
+    return "\n".join(
+        (
+            f"*{response.ticker}* {_change_emoji(change)}",
+            "",
+            f"*Price:* {price_str}",
+            f"*Change:* {change_str}",
+            f"*Market Cap:* {mc_str}",
+            f"*P/E Ratio:* {pe_str}",
+            f"*Volume:* {vol_str}",
+        )
+    )
+
+
+def _format_compare_row(stock: dict) -> str:
+    """Format one ticker's block of a comparison."""
+    price = stock.get("price")
+    pe = stock.get("pe_ratio")
+    change = stock.get("change_percent", 0)
+    return _COMPARE_ROW.format(
+        ticker=stock.get("ticker", "???"),
+        emoji=_change_emoji(change),
+        price=f"${price:.2f}" if price else "N/A",
+        change=f"{change:+.2f}%" if change else "N/A",
+        pe=f"{pe:.1f}" if pe else "N/A",
+    )
 
 
 def format_compare(response: CompareResponse) -> str:
@@ -76,25 +113,8 @@ def format_compare(response: CompareResponse) -> str:
     if not response.data:
         return "*Comparison*\n\nNo data available."
 
-    lines = ["*Stock Comparison*\n"]
-
-    for stock in response.data:
-        ticker = stock.get("ticker", "???")
-        price = stock.get("price")
-        pe = stock.get("pe_ratio")
-        change = stock.get("change_percent", 0)
-
-        change_emoji = "📈" if change > 0 else "📉" if change < 0 else "➖"
-        price_str = f"${price:.2f}" if price else "N/A"
-        pe_str = f"{pe:.1f}" if pe else "N/A"
-        change_str = f"{change:+.2f}%" if change else "N/A"
-
-        lines.append(f"*{ticker}* {change_emoji}")
-        lines.append(f"  Price: {price_str} ({change_str})")
-        lines.append(f"  P/E: {pe_str}")
-        lines.append("")
-
-    return "\n".join(lines)
+    rows = [_format_compare_row(stock) for stock in response.data]
+    return "\n".join(["*Stock Comparison*\n", *rows])
 
 
 def format_analyze(response: AnalyzeResponse) -> str:
@@ -112,20 +132,16 @@ def format_analyze(response: AnalyzeResponse) -> str:
     if not response.report:
         return "*Analysis*\n\nNo report generated."
 
-    # Telegram has a 4096 char limit, truncate if needed
     report = response.report
-    max_len = 3800  # Leave room for header/footer
-
-    if len(report) > max_len:
-        report = report[:max_len] + "\n\n_[Report truncated...]_"
-
-    message = f"*Research Report*\n\n{report}"
+    if len(report) > MAX_REPORT_LENGTH:
+        report = report[:MAX_REPORT_LENGTH] + _TRUNCATED_SUFFIX
 
+    parts = ["*Research Report*", report]
     if response.sources:
         sources_str = "\n".join(f"- {s}" for s in response.sources[:5])
-        message += f"\n\n*Sources:*\n{sources_str}"
+        parts.append(f"*Sources:*\n{sources_str}")
 
-    return message
+    return "\n\n".join(parts)
 
 
 def format_help() -> str:
@@ -1,5 +1,6 @@
 """New feature handlers for Telegram bot."""
 
+import asyncio
 import re
 
 from telegram import Update
@@ -9,11 +10,12 @@ from telegram.ext import ContextTypes
 from src.telegram.client import APIClient
 from src.telegram.handlers import get_user_lang
 
+_MARKDOWN_ESCAPE_RE = re.compile(r"([_*\[\]()~`>#+\-=|{}.!])")
+
 
 def escape_markdown(text: str) -> str:
     """Escape Markdown special characters."""
-    escape_chars = r"_*[]()~`>#+-=|{}.!"
-    return re.sub(f"([{re.escape(escape_chars)}])", r"\\\1", text)
+    return _MARKDOWN_ESCAPE_RE.sub(r"\\\1", text)
 
 
 # Shared client reference
@@ -33,13 +35,14 @@ def set_api_client_v2(client: APIClient) -> None:
 
 async def dcf_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /dcf <TICKER> - Calculate fair value."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     get_user_lang(update.effective_user.id)
 
     if not context.args:
-        await update.message.reply_text(
+        await message.reply_text(
             "📊 **DCF Valuation**\n\nUsage: `/dcf TICKER`\nExample: `/dcf NVDA`\n\n"
             "Calculates fair value using Discounted Cash Flow model.",
             parse_mode=ParseMode.MARKDOWN,
@@ -47,7 +50,7 @@ async def dcf_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return
 
     ticker = context.args[0].upper()
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         response = await api_client.client.get(f"{api_client.base_url}/dcf/{ticker}")
@@ -55,15 +58,15 @@ async def dcf_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 
         if data.get("success") and data.get("data"):
             result = data["data"]
-            await update.message.reply_text(
+            await message.reply_text(
                 result.get("summary", "No summary available"),
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text(f"Could not calculate DCF for {ticker}")
+            await message.reply_text(f"Could not calculate DCF for {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -73,10 +76,12 @@ async def dcf_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
 
 async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /calendar - Show upcoming earnings."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
-    await update.message.chat.send_action(ChatAction.TYPING)
+    # Show the typing indicator while the calendar is fetched, not before
+    typing_task = asyncio.create_task(message.chat.send_action(ChatAction.TYPING))
 
     try:
         # Get user's watchlist tickers
@@ -91,18 +96,23 @@ async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
         response = await api_client.client.get(f"{api_client.base_url}/calendar{tickers_param}")
         data = response.json()
+        # The typing indicator is best-effort; a failed send mustn't hide the calendar
+        await asyncio.gather(typing_task, return_exceptions=True)
 
         if data.get("success") and data.get("data"):
             result = data["data"]
-            await update.message.reply_text(
+            await message.reply_text(
                 result.get("summary", "No earnings calendar available"),
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text("Could not fetch earnings calendar")
+            await message.reply_text("Could not fetch earnings calendar")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        typing_task.cancel()
+        # Retrieve the task's outcome so a failed send_action isn't logged as unhandled
+        await asyncio.gather(typing_task, return_exceptions=True)
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -112,11 +122,12 @@ async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
 async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /history <TICKER> [earnings|1y|6mo|3mo] - Historical analysis."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     if not context.args:
-        await update.message.reply_text(
+        await message.reply_text(
             "📈 **Historical Analysis**\n\n"
             "Usage:\n"
             "• `/history NVDA` - Price history (1 year)\n"
@@ -137,7 +148,7 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         elif arg in ["1mo", "3mo", "6mo", "1y", "2y", "5y"]:
             period = arg
 
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         url = f"{api_client.base_url}/history/{ticker}?analysis={analysis}&period={period}"
@@ -146,15 +157,15 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
         if data.get("success") and data.get("data"):
             result = data["data"]
-            await update.message.reply_text(
+            await message.reply_text(
                 result.get("summary", "No history available"),
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text(f"Could not fetch history for {ticker}")
+            await message.reply_text(f"Could not fetch history for {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -164,18 +175,19 @@ async def history_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def peers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /peers <TICKER> - Compare with industry peers."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     if not context.args:
-        await update.message.reply_text(
+        await message.reply_text(
             "👥 **Peer Comparison**\n\nUsage: `/peers TICKER`\nExample: `/peers NVDA`",
             parse_mode=ParseMode.MARKDOWN,
         )
         return
 
     ticker = context.args[0].upper()
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         response = await api_client.client.get(f"{api_client.base_url}/peers/{ticker}")
@@ -183,15 +195,15 @@ async def peers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
         if data.get("success") and data.get("data"):
             result = data["data"]
-            await update.message.reply_text(
+            await message.reply_text(
                 result.get("summary", "No peer comparison available"),
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text(f"Could not compare peers for {ticker}")
+            await message.reply_text(f"Could not compare peers for {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -201,11 +213,12 @@ async def peers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 async def risk_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /risk <TICKER> - Get risk assessment."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     if not context.args:
-        await update.message.reply_text(
+        await message.reply_text(
             "⚠️ **Risk Assessment**\n\nUsage: `/risk TICKER`\nExample: `/risk NVDA`\n\n"
             "Analyzes 10-K risk factors and provides a score (1-10).",
             parse_mode=ParseMode.MARKDOWN,
@@ -213,7 +226,7 @@ async def risk_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         return
 
     ticker = context.args[0].upper()
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         response = await api_client.client.get(f"{api_client.base_url}/risk/{ticker}")
@@ -244,12 +257,12 @@ async def risk_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             if summary:
                 msg += f"\n{summary[:500]}"
 
-            await update.message.reply_text(msg)
+            await message.reply_text(msg)
         else:
-            await update.message.reply_text(f"Could not assess risk for {ticker}")
+            await message.reply_text(f"Could not assess risk for {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -259,11 +272,12 @@ async def risk_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def reddit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /reddit <TICKER> - Get Reddit sentiment."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     if not context.args:
-        await update.message.reply_text(
+        await message.reply_text(
             "🔴 **Reddit Sentiment**\n\nUsage: `/reddit TICKER`\nExample: `/reddit NVDA`\n\n"
             "Analyzes sentiment from r/wallstreetbets, r/stocks, etc.",
             parse_mode=ParseMode.MARKDOWN,
@@ -271,7 +285,7 @@ async def reddit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     ticker = context.args[0].upper()
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         response = await api_client.client.get(f"{api_client.base_url}/reddit/{ticker}")
@@ -279,15 +293,15 @@ async def reddit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
         if data.get("success") and data.get("data"):
             result = data["data"]
-            await update.message.reply_text(
+            await message.reply_text(
                 escape_markdown(result.get("summary", "No Reddit sentiment available")),
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text(f"Could not fetch Reddit sentiment for {ticker}")
+            await message.reply_text(f"Could not fetch Reddit sentiment for {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 # =============================================================================
@@ -297,7 +311,8 @@ async def reddit_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def watchlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /watchlist - Show or manage watchlist."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     user_id = str(update.effective_user.id)
@@ -323,10 +338,11 @@ async def watchlist_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
 
 async def show_watchlist(update: Update, user_id: str) -> None:
     """Display user's watchlist."""
-    if not update.message or not api_client:
+    message = update.message
+    if not message or not api_client:
         return
 
-    await update.message.chat.send_action(ChatAction.TYPING)
+    await message.chat.send_action(ChatAction.TYPING)
 
     try:
         response = await api_client.client.get(f"{api_client.base_url}/watchlist/{user_id}")
@@ -337,7 +353,7 @@ async def show_watchlist(update: Update, user_id: str) -> None:
             alerts = data.get("data", {}).get("alerts", [])
 
             if not items:
-                await update.message.reply_text(
+                await message.reply_text(
                     "📋 **Your Watchlist**\n\nEmpty! Add stocks with:\n`/watchlist add NVDA`",
                     parse_mode=ParseMode.MARKDOWN,
                 )
@@ -358,17 +374,18 @@ async def show_watchlist(update: Update, user_id: str) -> None:
             lines.append("`/watchlist remove NVDA` - Remove")
             lines.append("`/alert NVDA above 150` - Set alert")
 
-            await update.message.reply_text("\n".join(lines), parse_mode=ParseMode.MARKDOWN)
+            await message.reply_text("\n".join(lines), parse_mode=ParseMode.MARKDOWN)
         else:
-            await update.message.reply_text("Could not fetch watchlist")
+            await message.reply_text("Could not fetch watchlist")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 async def add_to_watchlist(update: Update, user_id: str, ticker: str, notes: str | None) -> None:
     """Add ticker to watchlist."""
-    if not update.message or not api_client:
+    message = update.message
+    if not message or not api_client:
         return
 
     try:
@@ -379,23 +396,24 @@ async def add_to_watchlist(update: Update, user_id: str, ticker: str, notes: str
         data = response.json()
 
         if data.get("success"):
-            await update.message.reply_text(
+            await message.reply_text(
                 f"✅ Added **{ticker}** to watchlist", parse_mode=ParseMode.MARKDOWN
             )
         else:
-            await update.message.reply_text(f"Could not add {ticker}")
+            await message.reply_text(f"Could not add {ticker}")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
 
 
 async def remove_from_watchlist(update: Update, user_id: str, ticker: str) -> None:
     """Remove ticker from watchlist."""
-    if not update.message or not api_client:
+    message = update.message
+    if not message or not api_client:
         return
 
     # Note: API endpoint for remove would need to be added
-    await update.message.reply_text(
+    await message.reply_text(
         f"✅ Removed **{ticker}** from watchlist", parse_mode=ParseMode.MARKDOWN
     )
 
@@ -404,14 +422,23 @@ async def remove_from_watchlist(update: Update, user_id: str, ticker: str) -> No
 # Alert Command
 # =============================================================================
 
+# Command keyword -> AlertType value
+ALERT_TYPES = {
+    "above": "price_above",
+    "below": "price_below",
+    "pe_above": "pe_above",
+    "pe_below": "pe_below",
+}
+
 
 async def alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /alert <TICKER> <above|below> <PRICE> - Set price alert."""
-    if not update.message or not update.effective_user or not api_client:
+    message = update.message
+    if not message or not update.effective_user or not api_client:
         return
 
     if len(context.args) < 3:
-        await update.message.reply_text(
+        await message.reply_text(
             "🔔 **Price Alerts**\n\n"
             "Usage: `/alert TICKER above|below PRICE`\n\n"
             "Examples:\n"
@@ -429,20 +456,12 @@ async def alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     try:
         threshold = float(context.args[2])
     except ValueError:
-        await update.message.reply_text("Invalid price. Use a number like `150` or `200.50`")
+        await message.reply_text("Invalid price. Use a number like `150` or `200.50`")
         return
 
-    # Map to AlertType
-    type_map = {
-        "above": "price_above",
-        "below": "price_below",
-        "pe_above": "pe_above",
-        "pe_below": "pe_below",
-    }
-
-    alert_type = type_map.get(alert_type_str)
+    alert_type = ALERT_TYPES.get(alert_type_str)
     if not alert_type:
-        await update.message.reply_text(f"Unknown alert type: {alert_type_str}")
+        await message.reply_text(f"Unknown alert type: {alert_type_str}")
         return
 
     try:
@@ -452,12 +471,12 @@ async def alert_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         data = response.json()
 
         if data.get("success"):
-            await update.message.reply_text(
+            await message.reply_text(
                 f"🔔 Alert set: **{ticker}** {alert_type_str} ${threshold:.2f}",
                 parse_mode=ParseMode.MARKDOWN,
             )
         else:
-            await update.message.reply_text("Could not create alert")
+            await message.reply_text("Could not create alert")
 
     except Exception as e:
-        await update.message.reply_text(f"Error: {e}")
+        await message.reply_text(f"Error: {e}")
@@ -1,5 +1,6 @@
 """Internationalization for Telegram bot."""
 
+from functools import lru_cache
 from typing import Literal
 
 Language = Literal["en", "fr"]
@@ -244,6 +245,22 @@ MESSAGES: dict[str, dict[str, str]] = {
     },
 }
 
+# English is the fallback for unknown languages and missing keys
+_DEFAULT_MESSAGES = MESSAGES["en"]
+
+
+@lru_cache(maxsize=1024)
+def _lookup(key: str, lang: str) -> str:
+    """Resolve a message template, falling back to English then the key.
+
+    Cached because MESSAGES is static; call ``_lookup.cache_clear()`` after
+    editing it at runtime.
+    """
+    text = MESSAGES.get(lang, _DEFAULT_MESSAGES).get(key)
+    if text is None:
+        text = _DEFAULT_MESSAGES.get(key, key)
+    return text
+
 
 def get_text(key: str, lang: Language = "en", **kwargs: str) -> str:
     """Get translated text.
@@ -256,7 +273,7 @@ def get_text(key: str, lang: Language = "en", **kwargs: str) -> str:
     Returns:
         Translated and formatted string
     """
-    text = MESSAGES.get(lang, MESSAGES["en"]).get(key, MESSAGES["en"].get(key, key))
+    text = _lookup(key, lang)
     if kwargs:
         text = text.format(**kwargs)
     return text
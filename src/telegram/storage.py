@@ -1,10 +1,13 @@
 """User preferences storage for Telegram bot."""
 
-import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from src.telegram.i18n import Language
 
 logger = logging.getLogger(__name__)
@@ -13,35 +16,76 @@ logger = logging.getLogger(__name__)
 # Using /tmp is intentional for ephemeral container storage
 STORAGE_FILE = Path("/tmp/telegram_bot_users.json")  # nosec B108
 
+# Writes within this window are coalesced into a single file rewrite
+SAVE_DELAY_SECONDS = 0.2
+
 
 class UserPreferences:
     """Manages user preferences."""
 
-    def __init__(self) -> None:
-        """Initialize storage."""
+    def __init__(self, storage_file: Path | None = STORAGE_FILE) -> None:
+        """Initialize storage.
+
+        Args:
+            storage_file: JSON file used to persist preferences, or None to
+                keep them in memory only
+        """
+        self._file = storage_file
         self._cache: dict[int, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        # Serializes file writes so the timer and close() never share the tmp file
+        self._write_lock = threading.Lock()
+        self._save_timer: threading.Timer | None = None
         self._load()
 
     def _load(self) -> None:
         """Load preferences from file."""
+        if self._file is None:
+            return
         try:
-            if STORAGE_FILE.exists():
-                with open(STORAGE_FILE) as f:
-                    data = json.load(f)
-                    # Convert string keys back to int
-                    self._cache = {int(k): v for k, v in data.items()}
+            if self._file.exists():
+                data = orjson.loads(self._file.read_bytes())
+                # Convert string keys back to int
+                self._cache = {int(k): v for k, v in data.items()}
                 logger.info(f"Loaded {len(self._cache)} user preferences")
         except Exception as e:
             logger.warning(f"Could not load preferences: {e}")
             self._cache = {}
 
     def _save(self) -> None:
-        """Save preferences to file."""
-        try:
-            with open(STORAGE_FILE, "w") as f:
-                json.dump(self._cache, f)
-        except Exception as e:
-            logger.warning(f"Could not save preferences: {e}")
+        """Schedule a save, coalescing bursts of updates into one write."""
+        if self._file is None:
+            return
+        with self._lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(SAVE_DELAY_SECONDS, self._flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def _flush(self) -> None:
+        """Write preferences to file atomically."""
+        if self._file is None:
+            return
+        with self._write_lock:
+            # Snapshot inside the write lock so a later write never loses to an older one
+            with self._lock:
+                if self._save_timer is threading.current_thread():
+                    self._save_timer = None
+                payload = orjson.dumps(self._cache, option=orjson.OPT_NON_STR_KEYS)
+            try:
+                tmp_file = self._file.with_suffix(".tmp")
+                tmp_file.write_bytes(payload)
+                os.replace(tmp_file, self._file)
+            except Exception as e:
+                logger.warning(f"Could not save preferences: {e}")
+
+    def close(self) -> None:
+        """Write any pending changes to file immediately."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+            self._flush()
 
     def get_language(self, user_id: int) -> Language | None:
         """Get user's preferred language.
@@ -65,9 +109,8 @@ class UserPreferences:
             user_id: Telegram user ID
             language: Language code
         """
-        if user_id not in self._cache:
-            self._cache[user_id] = {}
-        self._cache[user_id]["language"] = language
+        with self._lock:
+            self._cache.setdefault(user_id, {})["language"] = language
         self._save()
         logger.info(f"User {user_id} set language to {language}")
 
@@ -89,12 +132,12 @@ class UserPreferences:
             user_id: Telegram user ID
             state: State string or None to clear
         """
-        if user_id not in self._cache:
-            self._cache[user_id] = {}
-        if state is None:
-            self._cache[user_id].pop("state", None)
-        else:
-            self._cache[user_id]["state"] = state
+        with self._lock:
+            user_data = self._cache.setdefault(user_id, {})
+            if state is None:
+                user_data.pop("state", None)
+            else:
+                user_data["state"] = state
         self._save()
 
     def is_new_user(self, user_id: int) -> bool:
@@ -2,18 +2,20 @@
 
 from src.tools.earnings_call_tool import EarningsCallTool, get_earnings_call
 from src.tools.reddit_sentiment_tool import RedditSentimentTool, get_reddit_sentiment
-from src.tools.search_tool import DuckDuckGoSearchTool
+from src.tools.search_tool import DuckDuckGoSearchTool, get_search_tool
 from src.tools.sec_edgar_tool import SECEdgarTool
-from src.tools.yfinance_tool import YFinanceTool
+from src.tools.yfinance_tool import YFinanceTool, get_yfinance_tool
 
 # Alias for backward compatibility
 SearchTool = DuckDuckGoSearchTool
 
 __all__ = [
     "YFinanceTool",
+    "get_yfinance_tool",
     "SECEdgarTool",
     "SearchTool",
     "DuckDuckGoSearchTool",
+    "get_search_tool",
     "EarningsCallTool",
     "get_earnings_call",
     "RedditSentimentTool",
@@ -105,23 +105,22 @@ class DuckDuckGoSearchTool:
         search_limiter.acquire_sync("web")
 
         try:
-            results = []
             raw_results = self._ddgs.text(
                 query,
                 max_results=max_results,
                 region=region,
             )
 
-            for r in raw_results:
-                results.append(
-                    SearchResult(
-                        title=r.get("title", ""),
-                        url=r.get("href", r.get("link", "")),
-                        snippet=r.get("body", r.get("snippet", "")),
-                        source=r.get("source"),
-                        published=r.get("published"),
-                    )
+            results = [
+                SearchResult(
+                    title=r.get("title", ""),
+                    url=r.get("href", r.get("link", "")),
+                    snippet=r.get("body", r.get("snippet", "")),
+                    source=r.get("source"),
+                    published=r.get("published"),
                 )
+                for r in raw_results
+            ]
 
             # Cache results (15 min TTL for search)
             self._cache.set(cache_key, [r.to_dict() for r in results], ttl=900)
@@ -165,24 +164,23 @@ class DuckDuckGoSearchTool:
         search_limiter.acquire_sync("news")
 
         try:
-            results = []
             raw_results = self._ddgs.news(
                 query,
                 max_results=max_results,
                 timelimit=timelimit,
             )
 
-            for r in raw_results:
-                results.append(
-                    NewsResult(
-                        title=r.get("title", ""),
-                        url=r.get("url", r.get("link", "")),
-                        snippet=r.get("body", r.get("excerpt", "")),
-                        source=r.get("source", ""),
-                        date=r.get("date", ""),
-                        image=r.get("image"),
-                    )
+            results = [
+                NewsResult(
+                    title=r.get("title", ""),
+                    url=r.get("url", r.get("link", "")),
+                    snippet=r.get("body", r.get("excerpt", "")),
+                    source=r.get("source", ""),
+                    date=r.get("date", ""),
+                    image=r.get("image"),
                 )
+                for r in raw_results
+            ]
 
             # Cache results (10 min TTL for news)
             self._cache.set(cache_key, [r.to_dict() for r in results], ttl=600)
@@ -229,3 +227,15 @@ class DuckDuckGoSearchTool:
             query = f"{company} {topic}"
 
         return self.search(query, max_results=10)
+
+
+# Singleton instance
+_search_tool: DuckDuckGoSearchTool | None = None
+
+
+def get_search_tool() -> DuckDuckGoSearchTool:
+    """Get singleton DuckDuckGo search tool."""
+    global _search_tool
+    if _search_tool is None:
+        _search_tool = DuckDuckGoSearchTool()
+    return _search_tool
@@ -1,5 +1,6 @@
 """Yahoo Finance tool for real-time market data."""
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -14,8 +15,21 @@ from src.utils.rate_limiter import yfinance_limiter
 
 logger = structlog.get_logger()
 
+# Upper bound on concurrent Yahoo Finance lookups for multi-ticker requests
+MAX_FETCH_WORKERS = 8
 
-@dataclass
+# (StockQuote field, yfinance info key) pairs for the optional float fields
+_QUOTE_FLOAT_FIELDS = (
+    ("market_cap", "marketCap"),
+    ("pe_ratio", "trailingPE"),
+    ("forward_pe", "forwardPE"),
+    ("dividend_yield", "dividendYield"),
+    ("fifty_two_week_high", "fiftyTwoWeekHigh"),
+    ("fifty_two_week_low", "fiftyTwoWeekLow"),
+)
+
+
+@dataclass(slots=True)
 class StockQuote:
     """Real-time stock quote data."""
 
@@ -109,11 +123,15 @@ class YFinanceTool:
         """Safely convert value to float, handling NaN."""
         if value is None:
             return None
+        # Fast paths for the types yfinance returns; NaN is the only value where x != x
+        value_type = type(value)
+        if value_type is float:
+            return None if value != value else value
+        if value_type is int:
+            return float(value)
         try:
-            import math
-
             f = float(value)
-            return None if math.isnan(f) else f
+            return None if f != f else f
         except (ValueError, TypeError):
             return None
 
@@ -135,7 +153,8 @@ class YFinanceTool:
         Returns:
             StockQuote object or None if failed
         """
-        cache_key = f"yf:quote:{symbol.upper()}"
+        symbol = symbol.upper()
+        cache_key = f"yf:quote:{symbol}"
 
         # Check cache first (outside retry logic)
         cached = self._cache.get(cache_key)
@@ -166,22 +185,18 @@ class YFinanceTool:
                 logger.warning("yfinance_no_data", symbol=symbol)
                 return None
 
+            safe_float = self._safe_float
+            get = info.get
             quote = StockQuote(
-                symbol=info.get("symbol", symbol.upper()),
-                name=info.get("longName", info.get("shortName", symbol)),
-                price=self._safe_float(info.get("currentPrice", info.get("regularMarketPrice")))
-                or 0.0,
-                change=self._safe_float(info.get("regularMarketChange")) or 0.0,
-                change_percent=self._safe_float(info.get("regularMarketChangePercent")) or 0.0,
-                volume=self._safe_int(info.get("regularMarketVolume")),
-                market_cap=self._safe_float(info.get("marketCap")),
-                pe_ratio=self._safe_float(info.get("trailingPE")),
-                forward_pe=self._safe_float(info.get("forwardPE")),
-                dividend_yield=self._safe_float(info.get("dividendYield")),
-                fifty_two_week_high=self._safe_float(info.get("fiftyTwoWeekHigh")),
-                fifty_two_week_low=self._safe_float(info.get("fiftyTwoWeekLow")),
-                market_state=info.get("marketState", "UNKNOWN"),
+                symbol=get("symbol", symbol),
+                name=get("longName", get("shortName", symbol)),
+                price=safe_float(get("currentPrice", get("regularMarketPrice"))) or 0.0,
+                change=safe_float(get("regularMarketChange")) or 0.0,
+                change_percent=safe_float(get("regularMarketChangePercent")) or 0.0,
+                volume=self._safe_int(get("regularMarketVolume")),
+                market_state=get("marketState", "UNKNOWN"),
                 timestamp=datetime.now(),
+                **{field: safe_float(get(key)) for field, key in _QUOTE_FLOAT_FIELDS},
             )
 
             # Cache the result
@@ -207,7 +222,8 @@ class YFinanceTool:
         Returns:
             FinancialMetrics object or None if failed
         """
-        cache_key = f"yf:financials:{symbol.upper()}"
+        symbol = symbol.upper()
+        cache_key = f"yf:financials:{symbol}"
 
         # Check cache (longer TTL for financials as they change less frequently)
         cached = self._cache.get(cache_key)
@@ -227,7 +243,7 @@ class YFinanceTool:
                 return None
 
             metrics = FinancialMetrics(
-                symbol=symbol.upper(),
+                symbol=symbol,
                 revenue=self._safe_float(info.get("totalRevenue")),
                 net_income=self._safe_float(info.get("netIncomeToCommon")),
                 total_assets=self._safe_float(info.get("totalAssets")),
@@ -251,6 +267,31 @@ class YFinanceTool:
             logger.error("yfinance_financials_error", symbol=symbol, error=str(e))
             raise
 
+    def get_quotes(self, symbols: list[str]) -> dict[str, StockQuote | Exception | None]:
+        """Fetch quotes for several stocks concurrently.
+
+        A symbol whose fetch raised maps to the exception instead of failing
+        the whole batch, like ``asyncio.gather(..., return_exceptions=True)``.
+
+        Args:
+            symbols: List of ticker symbols
+
+        Returns:
+            Dictionary of symbol -> StockQuote, None if no data, or the exception
+        """
+        if not symbols:
+            return {}
+
+        def fetch(symbol: str) -> StockQuote | Exception | None:
+            try:
+                return self.get_quote(symbol)
+            except Exception as e:
+                return e
+
+        # Quotes are independent network calls, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(len(symbols), MAX_FETCH_WORKERS)) as executor:
+            return dict(zip(symbols, executor.map(fetch, symbols), strict=True))
+
     def compare_pe_ratios(self, symbols: list[str]) -> dict[str, float | None]:
         """Compare P/E ratios across multiple stocks.
 
@@ -260,10 +301,26 @@ class YFinanceTool:
         Returns:
             Dictionary of symbol -> P/E ratio
         """
-        results = {}
-        for symbol in symbols:
-            quote = self.get_quote(symbol)
-            results[symbol] = quote.pe_ratio if quote else None
-
+        quotes = self.get_quotes(symbols)
+        for quote in quotes.values():
+            if isinstance(quote, Exception):
+                raise quote
+
+        results = {
+            symbol: quote.pe_ratio if isinstance(quote, StockQuote) else None
+            for symbol, quote in quotes.items()
+        }
         logger.info("yfinance_pe_comparison", symbols=symbols, results=results)
         return results
+
+
+# Singleton instance
+_yfinance_tool: YFinanceTool | None = None
+
+
+def get_yfinance_tool() -> YFinanceTool:
+    """Get singleton YFinance tool."""
+    global _yfinance_tool
+    if _yfinance_tool is None:
+        _yfinance_tool = YFinanceTool()
+    return _yfinance_tool
@@ -1,43 +1,80 @@
 """In-memory caching utilities for API responses."""
 
 import hashlib
-import json
+import threading
 import time
-from functools import lru_cache
+from collections import OrderedDict
 from typing import Any
 
+import orjson
 import structlog
 
 from src.config import get_settings
 
 logger = structlog.get_logger()
 
+# Entries kept before the least recently used one is evicted
+DEFAULT_MAX_SIZE = 10_000
+
 
 class MemoryCache:
-    """Simple in-memory caching for API responses."""
+    """Simple in-memory LRU cache for API responses."""
+
+    __slots__ = ("_cache", "_default_ttl", "_max_size", "_lock", "_stop_sweeper")
 
-    def __init__(self, default_ttl: int = 3600) -> None:
+    def __init__(
+        self,
+        default_ttl: int = 3600,
+        max_size: int = DEFAULT_MAX_SIZE,
+        sweep_interval: float | None = None,
+    ) -> None:
         """Initialize memory cache.
 
         Args:
             default_ttl: Default TTL in seconds
+            max_size: Maximum number of entries before LRU eviction
+            sweep_interval: Seconds between background sweeps of expired
+                entries, or None to only expire entries lazily on lookup
         """
-        self._cache: dict[str, tuple[Any, float]] = {}
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
         self._default_ttl = default_ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._stop_sweeper = threading.Event()
+        if sweep_interval:
+            threading.Thread(
+                target=self._sweep_loop,
+                args=(sweep_interval,),
+                name="memory-cache-sweeper",
+                daemon=True,
+            ).start()
 
     @staticmethod
     def _make_key(prefix: str, *args: Any, **kwargs: Any) -> str:
         """Generate a cache key from prefix and arguments."""
-        key_data = json.dumps({"args": args, "kwargs": kwargs}, sort_keys=True)
-        key_hash = hashlib.sha256(key_data.encode()).hexdigest()[:16]
+        key_data = orjson.dumps(
+            {"args": args, "kwargs": kwargs},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        key_hash = hashlib.sha256(key_data).hexdigest()[:16]
         return f"{prefix}:{key_hash}"
 
     def _cleanup_expired(self) -> None:
         """Remove expired entries from cache."""
-        now = time.time()
-        expired = [k for k, (_, exp) in self._cache.items() if exp < now]
-        for key in expired:
-            del self._cache[key]
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (_, exp) in self._cache.items() if exp < now]
+            for key in expired:
+                del self._cache[key]
+
+    def _sweep_loop(self, interval: float) -> None:
+        """Periodically drop expired entries until close() is called."""
+        while not self._stop_sweeper.wait(interval):
+            self._cleanup_expired()
+
+    def close(self) -> None:
+        """Stop the background sweeper, if one is running."""
+        self._stop_sweeper.set()
 
     def get(self, key: str) -> Any | None:
         """Get value from cache.
@@ -48,18 +85,22 @@ class MemoryCache:
         Returns:
             Cached value or None if not found or expired
         """
-        self._cleanup_expired()
-
-        if key in self._cache:
-            value, expiry = self._cache[key]
-            if expiry > time.time():
-                logger.debug("cache_hit", key=key)
-                return value
-            else:
-                del self._cache[key]
-
-        logger.debug("cache_miss", key=key)
-        return None
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self._cache.move_to_end(key)
+                else:
+                    # Expired entries are dropped lazily when looked up
+                    del self._cache[key]
+                    entry = None
+
+        if entry is None:
+            logger.debug("cache_miss", key=key)
+            return None
+
+        logger.debug("cache_hit", key=key)
+        return entry[0]
 
     def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
         """Set value in cache.
@@ -73,11 +114,61 @@ class MemoryCache:
             True if successful
         """
         ttl = ttl or self._default_ttl
-        expiry = time.time() + ttl
-        self._cache[key] = (value, expiry)
+        expiry = time.monotonic() + ttl
+        with self._lock:
+            self._cache[key] = (value, expiry)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
         logger.debug("cache_set", key=key, ttl=ttl)
         return True
 
+    def get_many(self, keys: list[str]) -> list[Any | None]:
+        """Get several values from cache under a single lock acquisition.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order, None for missing or expired keys
+        """
+        now = time.monotonic()
+        values: list[Any | None] = []
+        with self._lock:
+            for key in keys:
+                entry = self._cache.get(key)
+                if entry is None:
+                    values.append(None)
+                elif entry[1] > now:
+                    self._cache.move_to_end(key)
+                    values.append(entry[0])
+                else:
+                    del self._cache[key]
+                    values.append(None)
+        logger.debug("cache_get_many", keys=len(keys))
+        return values
+
+    def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """Set several values in cache under a single lock acquisition.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (uses default if not specified)
+
+        Returns:
+            True if successful
+        """
+        ttl = ttl or self._default_ttl
+        expiry = time.monotonic() + ttl
+        with self._lock:
+            for key, value in items.items():
+                self._cache[key] = (value, expiry)
+                self._cache.move_to_end(key)
+            while len(self._cache) > self._max_size:
+                self._cache.popitem(last=False)
+        logger.debug("cache_set_many", keys=len(items), ttl=ttl)
+        return True
+
     def delete(self, key: str) -> bool:
         """Delete value from cache.
 
@@ -87,11 +178,11 @@ class MemoryCache:
         Returns:
             True if deleted, False if not found
         """
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            deleted = self._cache.pop(key, None) is not None
+        if deleted:
             logger.debug("cache_delete", key=key)
-            return True
-        return False
+        return deleted
 
     @property
     def is_connected(self) -> bool:
@@ -103,8 +194,30 @@ class MemoryCache:
 RedisCache = MemoryCache
 
 
-@lru_cache
+# Singleton instance
+_memory_cache: MemoryCache | None = None
+
+
 def get_cache() -> MemoryCache:
-    """Get cached memory cache instance."""
-    settings = get_settings()
-    return MemoryCache(default_ttl=settings.cache_ttl_seconds)
+    """Get singleton memory cache instance.
+
+    The first call starts a daemon thread that sweeps expired entries every
+    ttl/4 seconds; ``get_cache.cache_clear()`` stops it.
+    """
+    global _memory_cache
+    if _memory_cache is None:
+        ttl = get_settings().cache_ttl_seconds
+        _memory_cache = MemoryCache(default_ttl=ttl, sweep_interval=ttl / 4)
+    return _memory_cache
+
+
+def _clear_cache() -> None:
+    """Drop the singleton so the next get_cache() builds a fresh one."""
+    global _memory_cache
+    if _memory_cache is not None:
+        _memory_cache.close()
+    _memory_cache = None
+
+
+# Keep the lru_cache-style reset hook callers already rely on
+get_cache.cache_clear = _clear_cache  # type: ignore[attr-defined]
@@ -1,6 +1,7 @@
 """Rate limiting utilities for external API calls."""
 
 import asyncio
+import threading
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -12,37 +13,83 @@ logger = structlog.get_logger()
 
 T = TypeVar("T")
 
+# Buckets idle this long are full again and can be forgotten
+IDLE_PRUNE_SECONDS = 60.0
 
-@dataclass
+# Pruned buckets kept for reuse by new sources
+FREELIST_MAX_SIZE = 256
+
+
+@dataclass(slots=True)
 class RateLimitState:
-    """State for a rate limiter."""
+    """Token bucket for one rate-limited source."""
 
-    requests: list[float] = field(default_factory=list)
-    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    tokens: float
+    last_refill: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock | None = None  # created on first async acquire
+    sync_lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 class RateLimiter:
     """Token bucket rate limiter for API calls.
 
-    Implements a sliding window rate limiter that tracks requests
-    per source (e.g., different APIs have different limits).
+    Each source (e.g., different APIs have different limits) gets a bucket
+    holding up to ``burst`` tokens, refilled continuously at
+    ``requests_per_period / period_seconds`` tokens per second.
+
+    Any window of ``period_seconds`` admits at most
+    ``burst + requests_per_period - 1`` requests, so pass ``burst=1`` when
+    the API enforces a hard per-period limit.
     """
 
-    def __init__(self, requests_per_period: int = 100, period_seconds: int = 60) -> None:
+    def __init__(
+        self,
+        requests_per_period: int = 100,
+        period_seconds: int = 60,
+        burst: int | None = None,
+    ) -> None:
         """Initialize rate limiter.
 
         Args:
-            requests_per_period: Max requests allowed per period
+            requests_per_period: Requests allowed per period at the sustained rate
             period_seconds: Time period in seconds
+            burst: Bucket capacity (defaults to requests_per_period)
         """
         self._max_requests = requests_per_period
         self._period = period_seconds
-        self._states: dict[str, RateLimitState] = defaultdict(RateLimitState)
+        self._capacity = burst or requests_per_period
+        self._rate = requests_per_period / period_seconds
+        self._states: dict[str, RateLimitState] = defaultdict(self._new_state)
+        self._freelist: list[RateLimitState] = []
+
+    def _new_state(self) -> RateLimitState:
+        """Create a full bucket for a new source, reusing a pruned one if possible."""
+        if self._freelist:
+            state = self._freelist.pop()
+            state.tokens = float(self._capacity)
+            state.last_refill = time.monotonic()
+            # The old asyncio.Lock may belong to another event loop
+            state.lock = None
+            return state
+        return RateLimitState(tokens=float(self._capacity))
+
+    def _refill(self, state: RateLimitState) -> None:
+        """Add the tokens earned since the last refill, up to capacity."""
+        now = time.monotonic()
+        state.tokens = min(self._capacity, state.tokens + (now - state.last_refill) * self._rate)
+        state.last_refill = now
+
+    def _try_acquire(self, state: RateLimitState) -> float:
+        """Take a token if one is available.
 
-    def _cleanup_old_requests(self, state: RateLimitState) -> None:
-        """Remove requests outside the current window."""
-        cutoff = time.time() - self._period
-        state.requests = [t for t in state.requests if t > cutoff]
+        Returns:
+            0 if a token was taken, otherwise seconds until one is available
+        """
+        self._refill(state)
+        if state.tokens >= 1:
+            state.tokens -= 1
+            return 0.0
+        return (1 - state.tokens) / self._rate
 
     async def acquire(self, source: str = "default") -> None:
         """Acquire a rate limit slot, waiting if necessary.
@@ -50,27 +97,16 @@ class RateLimiter:
         Args:
             source: Identifier for the rate limit bucket (e.g., "yfinance", "sec")
         """
-        state = self._states[source]
-
-        async with state.lock:
-            while True:
-                self._cleanup_old_requests(state)
-
-                if len(state.requests) < self._max_requests:
-                    state.requests.append(time.time())
-                    logger.debug(
-                        "rate_limit_acquired",
-                        source=source,
-                        current=len(state.requests),
-                        max=self._max_requests,
-                    )
-                    return
+        while True:
+            state = self._states[source]
+            if state.lock is None:
+                state.lock = asyncio.Lock()
 
-                # Calculate wait time until oldest request expires
-                oldest = min(state.requests)
-                wait_time = oldest + self._period - time.time()
+            async with state.lock:
+                if self._states.get(source) is not state:
+                    continue  # Pruned before we got the lock; use the new bucket
 
-                if wait_time > 0:
+                while (wait_time := self._try_acquire(state)) > 0:
                     logger.info(
                         "rate_limit_waiting",
                         source=source,
@@ -78,34 +114,38 @@ class RateLimiter:
                     )
                     await asyncio.sleep(wait_time)
 
+                logger.debug(
+                    "rate_limit_acquired",
+                    source=source,
+                    remaining=int(state.tokens),
+                    max=self._capacity,
+                )
+                return
+
     def acquire_sync(self, source: str = "default") -> None:
         """Synchronous version of acquire for non-async contexts.
 
         Args:
             source: Identifier for the rate limit bucket
         """
-        state = self._states[source]
-
         while True:
-            self._cleanup_old_requests(state)
+            state = self._states[source]
 
-            if len(state.requests) < self._max_requests:
-                state.requests.append(time.time())
-                return
+            with state.sync_lock:
+                if self._states.get(source) is not state:
+                    continue  # Pruned before we got the lock; use the new bucket
 
-            oldest = min(state.requests)
-            wait_time = oldest + self._period - time.time()
-
-            if wait_time > 0:
-                logger.info(
-                    "rate_limit_waiting_sync",
-                    source=source,
-                    wait_seconds=round(wait_time, 2),
-                )
-                time.sleep(wait_time)
+                while (wait_time := self._try_acquire(state)) > 0:
+                    logger.info(
+                        "rate_limit_waiting_sync",
+                        source=source,
+                        wait_seconds=round(wait_time, 2),
+                    )
+                    time.sleep(wait_time)
+                return
 
     def remaining(self, source: str = "default") -> int:
-        """Get remaining requests in current window.
+        """Get requests that can be made right now without waiting.
 
         Args:
             source: Identifier for the rate limit bucket
@@ -114,11 +154,58 @@ class RateLimiter:
             Number of remaining requests
         """
         state = self._states[source]
-        self._cleanup_old_requests(state)
-        return max(0, self._max_requests - len(state.requests))
+        self._refill(state)
+        return int(state.tokens)
+
+    def prune(self, source: str, idle_seconds: float = IDLE_PRUNE_SECONDS) -> bool:
+        """Forget an idle source so its bucket can be reused.
+
+        Only buckets that have seen no activity for ``idle_seconds`` and are
+        not currently held are pruned. Use an ``idle_seconds`` of at least one
+        period so the bucket would have refilled anyway.
+
+        Args:
+            source: Identifier for the rate limit bucket
+            idle_seconds: Minimum time since the bucket was last used
+
+        Returns:
+            True if the source was pruned
+        """
+        state = self._states.get(source)
+        # Holding sync_lock keeps acquire_sync out while the bucket is removed;
+        # acquirers that looked it up earlier see it is gone and retry.
+        if state is None or not state.sync_lock.acquire(blocking=False):
+            return False
+        try:
+            if (
+                self._states.get(source) is not state
+                or time.monotonic() - state.last_refill < idle_seconds
+                or (state.lock is not None and state.lock.locked())
+            ):
+                return False
+            del self._states[source]
+        finally:
+            state.sync_lock.release()
+
+        if len(self._freelist) < FREELIST_MAX_SIZE:
+            self._freelist.append(state)
+        return True
+
+    def prune_all(self, idle_seconds: float = IDLE_PRUNE_SECONDS) -> int:
+        """Prune every idle source.
+
+        Args:
+            idle_seconds: Minimum time since a bucket was last used
+
+        Returns:
+            Number of sources pruned
+        """
+        return sum(self.prune(source, idle_seconds) for source in list(self._states))
 
 
 # Pre-configured rate limiters for different APIs
-yfinance_limiter = RateLimiter(requests_per_period=5, period_seconds=1)  # 5 req/s
-sec_limiter = RateLimiter(requests_per_period=10, period_seconds=1)  # 10 req/s
+# burst=1 keeps any one-second window at or under the per-period limit
+yfinance_limiter = RateLimiter(requests_per_period=5, period_seconds=1, burst=1)  # 5 req/s
+# SEC EDGAR enforces 10 req/s, so no burst on top of the sustained rate
+sec_limiter = RateLimiter(requests_per_period=10, period_seconds=1, burst=1)  # 10 req/s
 search_limiter = RateLimiter(requests_per_period=1, period_seconds=2)  # 0.5 req/s
@@ -1,7 +1,8 @@
 """Pytest configuration and fixtures."""
 
 import os
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
@@ -28,30 +29,45 @@ def _create_mock_settings():
     return settings
 
 
+# Every module-level reference to get_settings that tests must not resolve for real
+_SETTINGS_TARGETS = (
+    "src.config.settings.get_settings",
+    "src.config.get_settings",
+    "src.tools.yfinance_tool.get_settings",
+    "src.tools.sec_edgar_tool.get_settings",
+)
+
+
 @pytest.fixture(autouse=True)
-def auto_mock_settings():
+def auto_mock_settings(monkeypatch):
     """Automatically mock get_settings for all tests to avoid validation errors."""
     settings = _create_mock_settings()
+    get_settings = Mock(return_value=settings)
+    for target in _SETTINGS_TARGETS:
+        monkeypatch.setattr(target, get_settings)
+    return settings
 
-    with (
-        patch("src.config.settings.get_settings", return_value=settings),
-        patch("src.config.get_settings", return_value=settings),
-        patch("src.tools.yfinance_tool.get_settings", return_value=settings),
-        patch("src.tools.sec_edgar_tool.get_settings", return_value=settings),
-    ):
+
+@pytest.fixture(scope="class")
+def class_mock_settings():
+    """Mock get_settings for class-scoped fixtures, which set up before autouse ones."""
+    settings = _create_mock_settings()
+    get_settings = Mock(return_value=settings)
+    with pytest.MonkeyPatch.context() as mp:
+        for target in _SETTINGS_TARGETS:
+            mp.setattr(target, get_settings)
         yield settings
 
 
 @pytest.fixture
-def mock_settings():
+def mock_settings(monkeypatch):
     """Mock application settings (explicit fixture for tests that need the object)."""
-    with patch("src.config.settings.get_settings") as mock:
-        settings = _create_mock_settings()
-        mock.return_value = settings
-        yield settings
+    settings = _create_mock_settings()
+    monkeypatch.setattr("src.config.settings.get_settings", Mock(return_value=settings))
+    return settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_stock_info():
     """Sample yfinance stock info."""
     return {
@@ -75,10 +91,10 @@ def sample_stock_info():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_search_results():
-    """Sample DuckDuckGo search results."""
-    return [
+    """Sample DuckDuckGo search results, read-only so one copy serves every test."""
+    results = [
         {
             "title": "NVIDIA Stock Surges on AI Demand",
             "href": "https://example.com/nvidia-ai",
@@ -92,3 +108,81 @@ def sample_search_results():
             "source": "MarketWatch",
         },
     ]
+    return tuple(MappingProxyType(r) for r in results)
+
+
+@pytest.fixture(scope="session")
+def cached_quote_data():
+    """Cached StockQuote payload as stored by YFinanceTool.get_quote, read-only."""
+    return MappingProxyType(
+        {
+            "symbol": "NVDA",
+            "name": "NVIDIA Corporation",
+            "price": 875.50,
+            "change": 12.30,
+            "change_percent": 1.42,
+            "volume": 45000000,
+            "market_cap": 2150000000000,
+            "pe_ratio": 65.5,
+            "forward_pe": 45.2,
+            "dividend_yield": 0.0003,
+            "fifty_two_week_high": 950.00,
+            "fifty_two_week_low": 450.00,
+            "market_state": "REGULAR",
+            "timestamp": "2024-01-01T12:00:00",
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def cached_financials_data():
+    """Cached FinancialMetrics payload as stored by YFinanceTool.get_financials, read-only."""
+    return MappingProxyType(
+        {
+            "symbol": "NVDA",
+            "revenue": 60000000000,
+            "net_income": 20000000000,
+            "total_assets": None,
+            "total_debt": None,
+            "free_cash_flow": None,
+            "operating_margin": None,
+            "profit_margin": 0.33,
+            "return_on_equity": None,
+            "debt_to_equity": None,
+            "current_ratio": None,
+            "fiscal_year_end": None,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def cached_search_data():
+    """Cached web search results as stored by DuckDuckGoSearchTool.search, read-only."""
+    return (
+        MappingProxyType(
+            {
+                "title": "Cached Result",
+                "url": "https://example.com",
+                "snippet": "Cached content",
+                "source": "Cache",
+                "published": None,
+            }
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def cached_news_data():
+    """Cached news results as stored by DuckDuckGoSearchTool.search_news, read-only."""
+    return (
+        MappingProxyType(
+            {
+                "title": "Cached News",
+                "url": "https://news.com",
+                "snippet": "Content",
+                "source": "Source",
+                "date": "2024-01-01",
+                "image": None,
+            }
+        ),
+    )
@@ -8,14 +8,14 @@ import pytest
 class TestMarketDataAgent:
     """Tests for MarketDataAgent."""
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_analyze_success(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_analyze_success(self, mock_get_yfinance_tool):
         """Test successful analysis."""
         from src.agents.market_data import MarketDataAgent, MarketDataResult
 
         # Setup mocks
         mock_tool = MagicMock()
-        mock_yfinance_class.return_value = mock_tool
+        mock_get_yfinance_tool.return_value = mock_tool
 
         mock_quote = MagicMock()
         mock_quote.to_dict.return_value = {
@@ -45,13 +45,13 @@ class TestMarketDataAgent:
         assert "NVDA" in result.financials
         assert len(result.errors) == 0
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_analyze_no_quote_data(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_analyze_no_quote_data(self, mock_get_yfinance_tool):
         """Test handling of missing quote data."""
         from src.agents.market_data import MarketDataAgent
 
         mock_tool = MagicMock()
-        mock_yfinance_class.return_value = mock_tool
+        mock_get_yfinance_tool.return_value = mock_tool
         mock_tool.get_quote.return_value = None
         mock_tool.get_financials.return_value = None
 
@@ -60,13 +60,13 @@ class TestMarketDataAgent:
 
         assert "No quote data for INVALID" in result.errors
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_analyze_quote_exception(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_analyze_quote_exception(self, mock_get_yfinance_tool):
         """Test handling of quote fetch exception."""
         from src.agents.market_data import MarketDataAgent
 
         mock_tool = MagicMock()
-        mock_yfinance_class.return_value = mock_tool
+        mock_get_yfinance_tool.return_value = mock_tool
         mock_tool.get_quote.side_effect = Exception("API error")
         mock_tool.get_financials.return_value = None
 
@@ -75,13 +75,13 @@ class TestMarketDataAgent:
 
         assert any("Error fetching quote" in e for e in result.errors)
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_analyze_financials_exception(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_analyze_financials_exception(self, mock_get_yfinance_tool):
         """Test handling of financials fetch exception."""
         from src.agents.market_data import MarketDataAgent
 
         mock_tool = MagicMock()
-        mock_yfinance_class.return_value = mock_tool
+        mock_get_yfinance_tool.return_value = mock_tool
         mock_tool.get_quote.return_value = None
         mock_tool.get_financials.side_effect = Exception("Financials error")
 
@@ -94,7 +94,7 @@ class TestMarketDataAgent:
         """Test price formatting."""
         from src.agents.market_data import MarketDataAgent
 
-        with patch("src.agents.market_data.YFinanceTool"):
+        with patch("src.agents.market_data.get_yfinance_tool"):
             agent = MarketDataAgent()
 
         assert agent._format_price(None) == "N/A"
@@ -104,7 +104,7 @@ class TestMarketDataAgent:
         """Test large number formatting."""
         from src.agents.market_data import MarketDataAgent
 
-        with patch("src.agents.market_data.YFinanceTool"):
+        with patch("src.agents.market_data.get_yfinance_tool"):
             agent = MarketDataAgent()
 
         assert agent._format_large_number(None) == "N/A"
@@ -117,15 +117,15 @@ class TestMarketDataAgent:
         """Test percentage formatting."""
         from src.agents.market_data import MarketDataAgent
 
-        with patch("src.agents.market_data.YFinanceTool"):
+        with patch("src.agents.market_data.get_yfinance_tool"):
             agent = MarketDataAgent()
 
         assert agent._format_percent(None) == "N/A"
         assert agent._format_percent(0.33) == "33.00%"
         assert agent._format_percent(1.5) == "1.50%"
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_generate_summary_empty(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_generate_summary_empty(self, mock_get_yfinance_tool):
         """Test summary generation with no data."""
         from src.agents.market_data import MarketDataAgent
 
@@ -134,8 +134,8 @@ class TestMarketDataAgent:
 
         assert summary == "No market data available."
 
-    @patch("src.agents.market_data.YFinanceTool")
-    def test_generate_summary_with_data(self, mock_yfinance_class):
+    @patch("src.agents.market_data.get_yfinance_tool")
+    def test_generate_summary_with_data(self, mock_get_yfinance_tool):
         """Test summary generation with data."""
         from src.agents.market_data import MarketDataAgent
 
@@ -213,13 +213,13 @@ class TestMarketDataNode:
 class TestNewsSentimentAgent:
     """Tests for NewsSentimentAgent."""
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_analyze_success(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_analyze_success(self, mock_get_search_tool):
         """Test successful news analysis."""
         from src.agents.news_sentiment import NewsAnalysisResult, NewsSentimentAgent
 
         mock_tool = MagicMock()
-        mock_search_class.return_value = mock_tool
+        mock_get_search_tool.return_value = mock_tool
 
         mock_result = MagicMock()
         mock_result.to_dict.return_value = {
@@ -239,13 +239,13 @@ class TestNewsSentimentAgent:
         assert len(result.articles) == 1
         assert len(result.errors) == 0
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_analyze_search_error(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_analyze_search_error(self, mock_get_search_tool):
         """Test handling of search error."""
         from src.agents.news_sentiment import NewsSentimentAgent
 
         mock_tool = MagicMock()
-        mock_search_class.return_value = mock_tool
+        mock_get_search_tool.return_value = mock_tool
         mock_tool.search_stock_news.side_effect = Exception("Search failed")
 
         agent = NewsSentimentAgent()
@@ -254,8 +254,8 @@ class TestNewsSentimentAgent:
         assert len(result.articles) == 0
         assert any("News search failed" in e for e in result.errors)
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_generate_summary_empty(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_generate_summary_empty(self, mock_get_search_tool):
         """Test summary with no articles."""
         from src.agents.news_sentiment import NewsSentimentAgent
 
@@ -264,8 +264,8 @@ class TestNewsSentimentAgent:
 
         assert "No recent news found" in summary
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_generate_summary_with_articles(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_generate_summary_with_articles(self, mock_get_search_tool):
         """Test summary with articles."""
         from src.agents.news_sentiment import NewsSentimentAgent
 
@@ -284,13 +284,13 @@ class TestNewsSentimentAgent:
         assert "Test Article" in summary
         assert "..." in summary  # Truncated
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_search_topic_success(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_search_topic_success(self, mock_get_search_tool):
         """Test topic search."""
         from src.agents.news_sentiment import NewsSentimentAgent
 
         mock_tool = MagicMock()
-        mock_search_class.return_value = mock_tool
+        mock_get_search_tool.return_value = mock_tool
 
         mock_result = MagicMock()
         mock_result.to_dict.return_value = {"title": "China Supply Chain"}
@@ -301,13 +301,13 @@ class TestNewsSentimentAgent:
 
         assert len(results) == 1
 
-    @patch("src.agents.news_sentiment.DuckDuckGoSearchTool")
-    def test_search_topic_error(self, mock_search_class):
+    @patch("src.agents.news_sentiment.get_search_tool")
+    def test_search_topic_error(self, mock_get_search_tool):
         """Test topic search error handling."""
         from src.agents.news_sentiment import NewsSentimentAgent
 
         mock_tool = MagicMock()
-        mock_search_class.return_value = mock_tool
+        mock_get_search_tool.return_value = mock_tool
         mock_tool.search_financial_topic.side_effect = Exception("Search error")
 
         agent = NewsSentimentAgent()
@@ -1031,7 +1031,6 @@ class TestGraph:
         mock_graph.add_node.assert_called()
         mock_graph.compile.assert_called_once()
 
-    @pytest.mark.asyncio
     @patch("src.agents.graph.create_research_graph")
     async def test_run_research(self, mock_create_graph):
         """Test async research execution."""
@@ -0,0 +1,188 @@
+"""Tests for the in-memory cache."""
+
+import time
+
+import pytest
+
+from src.utils.cache import MemoryCache, RedisCache, get_cache
+
+pytestmark = pytest.mark.fast
+
+
+@pytest.fixture
+def memcache() -> MemoryCache:
+    """Fresh memory cache with the default TTL."""
+    return MemoryCache(default_ttl=3600)
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache class."""
+
+    def test_init(self):
+        """Test cache initialization."""
+        cache = MemoryCache(default_ttl=3600)
+        assert cache._default_ttl == 3600
+        assert cache._cache == {}
+
+    def test_make_key(self):
+        """Test cache key generation."""
+        key1 = MemoryCache._make_key("prefix", "arg1", kwarg1="value1")
+        key2 = MemoryCache._make_key("prefix", "arg1", kwarg1="value1")
+        key3 = MemoryCache._make_key("prefix", "arg2", kwarg1="value1")
+
+        assert key1 == key2  # Same args = same key
+        assert key1 != key3  # Different args = different key
+        assert key1.startswith("prefix:")
+
+    def test_make_key_unhashable_args(self):
+        """Test keys for unhashable arguments (lists, dicts)."""
+        key1 = MemoryCache._make_key("prefix", ["NVDA", "AMD"], filters={"sector": "tech"})
+        key2 = MemoryCache._make_key("prefix", ["NVDA", "AMD"], filters={"sector": "tech"})
+
+        assert key1 == key2
+        assert key1.startswith("prefix:")
+
+    def test_make_key_distinguishes_equal_values_of_different_types(self):
+        """Test that 1, True and 1.0 produce different keys."""
+        keys = {
+            MemoryCache._make_key("p", 1),
+            MemoryCache._make_key("p", True),
+            MemoryCache._make_key("p", 1.0),
+        }
+
+        assert len(keys) == 3
+
+    def test_set_and_get(self, memcache):
+        """Test basic set and get operations."""
+        result = memcache.set("test_key", {"data": "value"})
+        assert result is True
+
+        value = memcache.get("test_key")
+        assert value == {"data": "value"}
+
+    def test_get_miss(self, memcache):
+        """Test cache miss."""
+        result = memcache.get("nonexistent_key")
+        assert result is None
+
+    def test_get_expired(self):
+        """Test expired cache entry."""
+        cache = MemoryCache(default_ttl=1)
+        # Manually set an expired entry
+        cache._cache["test_key"] = ({"data": "value"}, time.monotonic() - 1)  # Already expired
+
+        result = cache.get("test_key")
+        assert result is None
+
+    def test_set_custom_ttl(self, memcache):
+        """Test cache set with custom TTL."""
+        memcache.set("test_key", {"data": "value"}, ttl=7200)
+
+        value, expiry = memcache._cache["test_key"]
+        assert value == {"data": "value"}
+        # Expiry should be ~7200 seconds in the future
+        assert expiry > time.monotonic() + 7000
+
+    def test_delete_existing(self, memcache):
+        """Test deleting existing key."""
+        memcache.set("test_key", "value")
+
+        result = memcache.delete("test_key")
+        assert result is True
+        assert memcache.get("test_key") is None
+
+    def test_delete_nonexistent(self, memcache):
+        """Test deleting nonexistent key."""
+        result = memcache.delete("nonexistent")
+        assert result is False
+
+    def test_is_connected(self, memcache):
+        """Test is_connected property (always True for memory cache)."""
+        assert memcache.is_connected is True
+
+    def test_cleanup_expired(self, memcache):
+        """Test cleanup of expired entries."""
+        # Add entries with different expiries
+        memcache._cache["expired"] = ("value", time.monotonic() - 10)  # Already expired
+        memcache._cache["valid"] = ("value", time.monotonic() + 3600)  # Still valid
+
+        memcache._cleanup_expired()
+
+        assert "expired" not in memcache._cache
+        assert "valid" in memcache._cache
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now the least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+
+    def test_set_many_and_get_many(self, memcache):
+        """Test batched set and get operations."""
+        assert memcache.set_many({"a": {"x": 1}, "b": [2]}) is True
+        assert memcache.get_many(["a", "missing", "b"]) == [{"x": 1}, None, [2]]
+
+    def test_get_many_expired(self, memcache):
+        """Test that get_many drops expired entries."""
+        memcache.set_many({"a": 1, "b": 2}, ttl=1)
+        memcache._cache["a"] = (1, time.monotonic() - 1)
+
+        assert memcache.get_many(["a", "b"]) == [None, 2]
+        assert "a" not in memcache._cache
+
+    @pytest.mark.slow
+    def test_background_sweep_removes_expired(self):
+        """Test that the sweeper drops expired entries without a lookup."""
+        cache = MemoryCache(sweep_interval=0.01)
+        cache.set("fresh", 1)
+        cache._cache["stale"] = (2, time.monotonic() - 1)
+
+        deadline = time.monotonic() + 1
+        while "stale" in cache._cache and time.monotonic() < deadline:
+            time.sleep(0.01)
+        cache.close()
+
+        assert "stale" not in cache._cache
+        assert cache.get("fresh") == 1
+
+
+class TestGetCache:
+    """Tests for get_cache function."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_singleton(self):
+        """Start from a fresh singleton and stop its sweeper thread afterwards."""
+        get_cache.cache_clear()
+        yield
+        get_cache.cache_clear()
+
+    def test_get_cache(self):
+        """Test get_cache singleton."""
+        cache1 = get_cache()
+        cache2 = get_cache()
+
+        # Should return same instance (cached)
+        assert cache1 is cache2
+
+    def test_cache_clear_stops_sweeper(self):
+        """Test that resetting the singleton stops its background sweeper."""
+        cache = get_cache()
+
+        get_cache.cache_clear()
+
+        assert cache._stop_sweeper.is_set()
+        assert get_cache() is not cache
+
+
+class TestRedisBackwardsCompatibility:
+    """Test backwards compatibility alias."""
+
+    def test_redis_cache_alias(self):
+        """Test that RedisCache is aliased to MemoryCache."""
+        assert RedisCache is MemoryCache
@@ -0,0 +1,222 @@
+"""Tests for the rate limiter."""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.rate_limiter import (
+    RateLimiter,
+    search_limiter,
+    sec_limiter,
+    yfinance_limiter,
+)
+
+pytestmark = pytest.mark.fast
+
+
+class _GatedLock:
+    """Lock whose ``with`` entry pauses until the test opens the gate."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.entering = threading.Event()
+        self.gate = threading.Event()
+
+    def __enter__(self) -> None:
+        self.entering.set()
+        self.gate.wait(timeout=5)
+        self._lock.acquire()
+
+    def __exit__(self, *exc: object) -> None:
+        self._lock.release()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        return self._lock.acquire(blocking)
+
+    def release(self) -> None:
+        self._lock.release()
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    def test_init(self):
+        """Test rate limiter initialization."""
+        limiter = RateLimiter(requests_per_period=10, period_seconds=60)
+
+        assert limiter._max_requests == 10
+        assert limiter._period == 60
+
+    def test_remaining_full(self):
+        """Test remaining when no requests made."""
+        limiter = RateLimiter(requests_per_period=10, period_seconds=60)
+        remaining = limiter.remaining("test")
+
+        assert remaining == 10
+
+    def test_remaining_after_requests(self):
+        """Test remaining after some requests."""
+        limiter = RateLimiter(requests_per_period=10, period_seconds=60)
+
+        # Make some requests
+        for _ in range(3):
+            limiter.acquire_sync("test")
+
+        remaining = limiter.remaining("test")
+        assert remaining == 7
+
+    def test_acquire_sync_success(self):
+        """Test synchronous acquire."""
+        limiter = RateLimiter(requests_per_period=5, period_seconds=60)
+
+        # Should acquire without waiting
+        start = time.perf_counter()
+        for _ in range(5):
+            limiter.acquire_sync("test")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1  # Should be near-instant
+
+    @pytest.mark.slow
+    def test_burst_of_one_caps_requests_per_period(self):
+        """Test that with burst=1 the (N+1)th acquire lands a full period later."""
+        limiter = RateLimiter(requests_per_period=5, period_seconds=0.2, burst=1)
+
+        start = time.perf_counter()
+        for _ in range(6):
+            limiter.acquire_sync("test")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.19  # Five waits of 0.04s after the first token
+
+    @pytest.mark.slow
+    def test_acquire_sync_rate_limited(self):
+        """Test synchronous acquire with rate limiting."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=0.2)
+
+        # Fill the bucket
+        limiter.acquire_sync("test")
+        limiter.acquire_sync("test")
+
+        # This should wait
+        start = time.perf_counter()
+        limiter.acquire_sync("test")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09  # Waited for one token (0.1s)
+
+    async def test_acquire_async_success(self):
+        """Test async acquire."""
+        limiter = RateLimiter(requests_per_period=5, period_seconds=60)
+
+        # Should acquire without waiting
+        start = time.perf_counter()
+        for _ in range(5):
+            await limiter.acquire("test")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1
+
+    @pytest.mark.slow
+    async def test_acquire_async_rate_limited(self):
+        """Test async acquire with rate limiting."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=0.2)
+
+        # Fill the bucket
+        await limiter.acquire("test")
+        await limiter.acquire("test")
+
+        # This should wait
+        start = time.perf_counter()
+        await limiter.acquire("test")
+        elapsed = time.perf_counter() - start
+
+        assert elapsed >= 0.09
+
+    def test_tokens_refill_over_time(self):
+        """Test that spent tokens are refilled as time passes."""
+        limiter = RateLimiter(requests_per_period=5, period_seconds=1)
+        for _ in range(5):
+            limiter.acquire_sync("test")
+        assert limiter.remaining("test") == 0
+
+        # Pretend a full period has elapsed since the last refill
+        limiter._states["test"].last_refill -= 1
+
+        assert limiter.remaining("test") == 5
+
+    def test_prune_reuses_idle_buckets(self):
+        """Test that idle sources are pruned onto the freelist and reused."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=1)
+        limiter.acquire_sync("idle")
+        limiter.acquire_sync("busy")
+        limiter._states["idle"].last_refill -= 120
+
+        assert limiter.prune_all() == 1
+        assert "idle" not in limiter._states
+        assert len(limiter._freelist) == 1
+
+        recycled = limiter._freelist[0]
+        assert limiter._states["new"] is recycled
+        assert limiter.remaining("new") == 2
+
+    async def test_reused_bucket_drops_its_async_lock(self):
+        """Test that a recycled bucket starts fresh instead of keeping its old lock."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=60)
+        await limiter.acquire("old")
+        limiter._states["old"].last_refill -= 120
+        assert limiter.prune("old") is True
+
+        state = limiter._states["new"]
+
+        assert state.lock is None
+        assert state.tokens == 2
+
+    def test_acquire_sync_retries_when_bucket_pruned_before_locking(self):
+        """Test that a bucket recycled to another source isn't spent by a stale lookup."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=60)
+        stale = limiter._states["a"]
+        stale.last_refill -= 120
+        stale.sync_lock = gated = _GatedLock()
+
+        worker = threading.Thread(target=limiter.acquire_sync, args=("a",))
+        worker.start()
+        assert gated.entering.wait(timeout=5)  # Looked up, not yet locked
+
+        assert limiter.prune("a") is True
+        assert limiter._states["b"] is stale
+
+        gated.gate.set()
+        worker.join(timeout=5)
+
+        assert limiter.remaining("b") == 2
+        assert limiter.remaining("a") == 1
+
+    def test_multiple_sources(self):
+        """Test rate limiting with multiple sources."""
+        limiter = RateLimiter(requests_per_period=2, period_seconds=60)
+
+        # Each source has its own bucket
+        limiter.acquire_sync("source1")
+        limiter.acquire_sync("source1")
+        limiter.acquire_sync("source2")
+        limiter.acquire_sync("source2")
+
+        assert limiter.remaining("source1") == 0
+        assert limiter.remaining("source2") == 0
+
+
+class TestPreConfiguredLimiters:
+    """Tests for pre-configured rate limiters."""
+
+    @pytest.mark.parametrize(
+        ("limiter", "max_requests", "period", "capacity"),
+        [(yfinance_limiter, 5, 1, 1), (sec_limiter, 10, 1, 1), (search_limiter, 1, 2, 1)],
+        ids=["yfinance", "sec", "search"],
+    )
+    def test_limiter_configuration(self, limiter, max_requests, period, capacity):
+        """Test each pre-configured limiter's budget."""
+        assert limiter._max_requests == max_requests
+        assert limiter._period == period
+        assert limiter._capacity == capacity
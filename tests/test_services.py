@@ -1,6 +1,34 @@
 """Tests for service modules."""
 
+import importlib
+from operator import attrgetter
+from unittest.mock import Mock
 
+import pytest
+
+
+@pytest.fixture(scope="module")
+def peer_service():
+    """Shared read-only PeerComparisonService."""
+    from src.services.peer_comparison import PeerComparisonService
+
+    return PeerComparisonService()
+
+
+@pytest.mark.parametrize(
+    ("module", "name", "key"),
+    [
+        ("peer_comparison", "PEER_GROUPS", "AAPL"),
+        ("peer_comparison", "PEER_GROUPS", "NVDA"),
+        ("earnings_calendar", "EarningsCalendarService.MAJOR_TICKERS", "AAPL"),
+        ("earnings_calendar", "EarningsCalendarService.MAJOR_TICKERS", "MSFT"),
+    ],
+)
+def test_constant_contains(module: str, name: str, key: str) -> None:
+    """Test that service lookup constants contain the major tickers."""
+    constant = attrgetter(name)(importlib.import_module(f"src.services.{module}"))
+
+    assert key in constant
 
 
 class TestChatService:
@@ -94,50 +122,23 @@ class TestEarningsCalendarService:
         service = EarningsCalendarService()
         assert service is not None
 
-    def test_major_tickers_defined(self):
-        """Test that major tickers are defined."""
-        from src.services.earnings_calendar import EarningsCalendarService
-
-        assert len(EarningsCalendarService.MAJOR_TICKERS) > 0
-        assert "AAPL" in EarningsCalendarService.MAJOR_TICKERS
-        assert "MSFT" in EarningsCalendarService.MAJOR_TICKERS
-
 
 class TestPeerComparisonService:
     """Tests for PeerComparisonService."""
 
-    def test_init(self):
+    def test_init(self, peer_service):
         """Test service initialization."""
-        from src.services.peer_comparison import PeerComparisonService
-
-        service = PeerComparisonService()
-        assert service is not None
+        assert peer_service is not None
 
-    def test_peer_groups_defined(self):
-        """Test that peer groups are defined."""
-        from src.services.peer_comparison import PEER_GROUPS
-
-        assert len(PEER_GROUPS) > 0
-        assert "AAPL" in PEER_GROUPS
-        assert "NVDA" in PEER_GROUPS
-
-    def test_get_peers_known_ticker(self):
+    def test_get_peers_known_ticker(self, peer_service):
         """Test getting peers for known ticker."""
-        from src.services.peer_comparison import PeerComparisonService
-
-        service = PeerComparisonService()
-
-        peers = service.get_peers("NVDA")
+        peers = peer_service.get_peers("NVDA")
         assert "AMD" in peers
         assert "INTC" in peers
 
-    def test_get_peers_unknown_ticker(self):
+    def test_get_peers_unknown_ticker(self, peer_service):
         """Test getting peers for unknown ticker."""
-        from src.services.peer_comparison import PeerComparisonService
-
-        service = PeerComparisonService()
-
-        peers = service.get_peers("UNKNOWN123")
+        peers = peer_service.get_peers("UNKNOWN123")
         assert peers == []
 
 
@@ -169,6 +170,38 @@ class TestHistoricalAnalysisService:
         )
         assert reaction.date == "2024-01-01"
 
+    def test_earnings_reactions_from_synthetic_history(self, monkeypatch):
+        """Test the price moves computed around each earnings date."""
+        import pandas as pd
+
+        from src.services.historical_analysis import HistoricalAnalysisService
+
+        closes = [100.0, 102.0, 98.0, 99.0, 110.0, 121.0, 120.0, 118.0, 119.0, 125.0]
+        history = pd.DataFrame(
+            {"Close": closes},
+            index=pd.bdate_range("2024-01-01", periods=len(closes)),
+        )
+        earnings = pd.DataFrame(
+            {"epsActual": [1.2, 0.9, 1.0], "epsEstimate": [1.0, 1.0, 1.0]},
+            # Wednesday, a Saturday between two sessions, and a date past the history
+            index=pd.to_datetime(["2024-01-03", "2024-01-06", "2024-01-20"]),
+        )
+        stock = Mock(earnings_history=earnings)
+        stock.history.return_value = history
+        monkeypatch.setattr("yfinance.Ticker", Mock(return_value=stock))
+
+        pattern = HistoricalAnalysisService().get_earnings_reactions("nvda")
+
+        assert [
+            (r.date, r.price_before, r.price_after, r.change_percent)
+            for r in pattern.recent_reactions
+        ] == [("2024-01-03", 98.0, 98.0, 0.0), ("2024-01-06", 110.0, 121.0, 10.0)]
+        assert pattern.ticker == "NVDA"
+        assert pattern.positive_surprises == 1
+        assert pattern.negative_surprises == 1
+        assert pattern.avg_earnings_move == 5.0
+        assert pattern.largest_move.date == "2024-01-06"
+
 
 class TestWatchlistService:
     """Tests for WatchlistService."""
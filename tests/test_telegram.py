@@ -1,6 +1,6 @@
 """Tests for Telegram bot module."""
 
-
+import pytest
 
 from src.telegram.client import AnalyzeResponse, CompareResponse, QuoteResponse
 from src.telegram.formatters import (
@@ -50,6 +50,52 @@ class TestFormatters:
         assert "-1.50%" in result
         assert "$250.00B" in result
 
+    def test_format_quote_just_below_suffix_boundary(self) -> None:
+        """Test that values a hair below a power of 1000 keep the smaller suffix."""
+        trillion = format_quote(QuoteResponse(ticker="T", market_cap=999999999999.9999))
+        million = format_quote(QuoteResponse(ticker="M", market_cap=999999.9999999999))
+
+        assert "$1000.00B" in trillion
+        assert "$1,000,000" in million
+
+    @pytest.mark.parametrize(
+        ("market_cap", "expected"),
+        [
+            (999_999.5, "$1,000,000"),
+            (999_999.9999999999, "$1,000,000"),
+            (1_000_000, "$1.00M"),
+            (999_999_999.6, "$1000.00M"),
+            (999_999_999_999.6, "$1000.00B"),
+            (1e12, "$1.00T"),
+            (5e15, "$5000.00T"),
+            (float("nan"), "$nan"),
+            (float("inf"), "$inf"),
+        ],
+    )
+    def test_format_quote_market_cap_scaling(self, market_cap: float, expected: str) -> None:
+        """Test market cap formatting at suffix boundaries and for non-finite values."""
+        result = format_quote(QuoteResponse(ticker="T", market_cap=market_cap))
+
+        assert f"*Market Cap:* {expected}" in result
+
+    @pytest.mark.parametrize(
+        ("volume", "expected"),
+        [
+            (999, "999"),
+            (1_000, "1.0K"),
+            (999_999, "1000.0K"),
+            (999_999.5, "1000.0K"),
+            (1_000_000, "1.0M"),
+            (float("nan"), "nan"),
+            (float("inf"), "inf"),
+        ],
+    )
+    def test_format_quote_volume_scaling(self, volume: float, expected: str) -> None:
+        """Test volume formatting at suffix boundaries and for non-finite values."""
+        result = format_quote(QuoteResponse(ticker="T", volume=volume))
+
+        assert f"*Volume:* {expected}" in result
+
     def test_format_quote_error(self) -> None:
         """Test formatting a quote with error."""
         response = QuoteResponse(ticker="INVALID", error="Ticker not found")
@@ -226,6 +272,29 @@ class TestAPIClient:
         client = APIClient(base_url="http://localhost:8000")
         assert client.base_url == "http://localhost:8000"
 
+    async def test_get_quote_parses_response(self):
+        """Test that get_quote decodes the API envelope."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+
+        from src.telegram.client import APIClient
+
+        client = APIClient(base_url="http://localhost:8000")
+        client.client.get = AsyncMock(
+            return_value=httpx.Response(
+                200,
+                json={"success": True, "data": {"symbol": "NVDA", "price": 950.5}},
+            )
+        )
+
+        quote = await client.get_quote("nvda")
+
+        assert quote.ticker == "NVDA"
+        assert quote.price == 950.5
+        assert quote.error is None
+        await client.close()
+
 
 class TestHandlersV2:
     """Test handlers_v2 module."""
@@ -252,6 +321,70 @@ class TestHandlersV2:
 
         assert handlers_v2.api_client is client
 
+    async def test_alert_command_unknown_type(self):
+        """Test that an unknown alert type is rejected before calling the API."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.telegram import handlers_v2
+
+        client = MagicMock()
+        handlers_v2.set_api_client_v2(client)
+        update = MagicMock()
+        update.message.reply_text = AsyncMock()
+        context = MagicMock(args=["NVDA", "sideways", "150"])
+
+        await handlers_v2.alert_command(update, context)
+
+        update.message.reply_text.assert_awaited_once_with("Unknown alert type: sideways")
+        client.client.post.assert_not_called()
+
+    async def test_calendar_command(self):
+        """Test that /calendar shows typing and replies with the summary."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.telegram import handlers_v2
+
+        client = MagicMock()
+        client.base_url = "http://api"
+        watchlist = MagicMock(status_code=200)
+        watchlist.json.return_value = {"success": True, "data": {"tickers": ["NVDA"]}}
+        calendar = MagicMock()
+        calendar.json.return_value = {"success": True, "data": {"summary": "NVDA reports soon"}}
+        client.client.get = AsyncMock(side_effect=[watchlist, calendar])
+        handlers_v2.set_api_client_v2(client)
+        update = MagicMock()
+        update.effective_user.id = 42
+        update.message.chat.send_action = AsyncMock()
+        update.message.reply_text = AsyncMock()
+
+        await handlers_v2.calendar_command(update, MagicMock())
+
+        update.message.chat.send_action.assert_awaited_once()
+        client.client.get.assert_awaited_with("http://api/calendar?tickers=NVDA")
+        assert update.message.reply_text.await_args.args[0] == "NVDA reports soon"
+
+    async def test_calendar_command_typing_failure_still_replies(self):
+        """Test that a failed typing indicator doesn't replace the fetched calendar."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from src.telegram import handlers_v2
+
+        client = MagicMock()
+        client.base_url = "http://api"
+        watchlist = MagicMock(status_code=404)
+        calendar = MagicMock()
+        calendar.json.return_value = {"success": True, "data": {"summary": "No earnings soon"}}
+        client.client.get = AsyncMock(side_effect=[watchlist, calendar])
+        handlers_v2.set_api_client_v2(client)
+        update = MagicMock()
+        update.message.chat.send_action = AsyncMock(side_effect=RuntimeError("timed out"))
+        update.message.reply_text = AsyncMock()
+
+        await handlers_v2.calendar_command(update, MagicMock())
+
+        update.message.reply_text.assert_awaited_once()
+        assert update.message.reply_text.await_args.args[0] == "No earnings soon"
+
 
 class TestI18n:
     """Test i18n module."""
@@ -277,3 +410,50 @@ class TestI18n:
 
         text = get_text("welcome", "unknown_lang")
         assert text is not None
+
+
+class TestUserPreferences:
+    """Test UserPreferences storage."""
+
+    def test_set_and_get_language(self):
+        """Test language round-trip through the in-memory cache."""
+        from src.telegram.storage import UserPreferences
+
+        storage = UserPreferences(storage_file=None)
+        storage.set_language(42, "fr")
+
+        assert storage.get_language(42) == "fr"
+        assert storage.is_new_user(42) is False
+        storage.close()
+
+    def test_memory_only_storage_skips_disk(self, tmp_path, monkeypatch):
+        """Test that memory-only storage never schedules a write."""
+        from src.telegram.storage import UserPreferences
+
+        monkeypatch.chdir(tmp_path)
+        storage = UserPreferences(storage_file=None)
+        storage.set_state(42, "waiting_quote")
+
+        assert storage._save_timer is None
+        assert storage.get_state(42) == "waiting_quote"
+        storage.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_writes_are_coalesced(self, tmp_path, monkeypatch):
+        """Test that a burst of updates is written once on close."""
+        from src.telegram.storage import UserPreferences
+
+        # Keep the debounce timer from firing before close()
+        monkeypatch.setattr("src.telegram.storage.SAVE_DELAY_SECONDS", 60)
+        storage_file = tmp_path / "users.json"
+        storage = UserPreferences(storage_file=storage_file)
+        storage.set_language(42, "en")
+        storage.set_state(42, "waiting_quote")
+
+        assert not storage_file.exists()
+
+        storage.close()
+        reloaded = UserPreferences(storage_file=storage_file)
+
+        assert reloaded.get_language(42) == "en"
+        assert reloaded.get_state(42) == "waiting_quote"
@@ -1,12 +1,181 @@
 """Tests for data source tools."""
 
+import copy
 from datetime import datetime
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
+import httpx
 import pytest
+from tenacity import RetryError, wait_none
 
 from src.tools.search_tool import DuckDuckGoSearchTool, NewsResult, SearchResult
+from src.tools.sec_edgar_tool import SECEdgarTool, SECFiling
 from src.tools.yfinance_tool import FinancialMetrics, StockQuote, YFinanceTool
+from src.utils.rate_limiter import RateLimiter
+
+# Every data source is mocked, so these tests can be spread across xdist workers
+pytestmark = pytest.mark.fast
+
+# Canonical instances built once; tests copy them when they need their own object
+_QUOTE_TEMPLATE = StockQuote(
+    symbol="NVDA",
+    name="NVIDIA Corporation",
+    price=875.50,
+    change=12.30,
+    change_percent=1.42,
+    volume=45000000,
+    market_cap=2150000000000,
+    pe_ratio=65.5,
+    forward_pe=45.2,
+    dividend_yield=0.0003,
+    fifty_two_week_high=950.00,
+    fifty_two_week_low=450.00,
+    market_state="REGULAR",
+    timestamp=datetime(2024, 1, 1, 12, 0, 0),
+)
+
+_METRICS_TEMPLATE = FinancialMetrics(
+    symbol="NVDA",
+    revenue=60000000000,
+    net_income=20000000000,
+    total_assets=100000000000,
+    total_debt=10000000000,
+    free_cash_flow=15000000000,
+    operating_margin=0.45,
+    profit_margin=0.33,
+    return_on_equity=0.40,
+    debt_to_equity=0.20,
+    current_ratio=2.5,
+    fiscal_year_end="2024-01-31",
+)
+
+_SEARCH_RESULT_TEMPLATE = SearchResult(
+    title="Test",
+    url="https://example.com",
+    snippet="Content",
+    source="Source",
+    published="2024-01-01",
+)
+
+_NEWS_RESULT_TEMPLATE = NewsResult(
+    title="News",
+    url="https://news.com",
+    snippet="Content",
+    source="Source",
+    date="2024-01-01",
+    image="https://img.com/image.jpg",
+)
+
+_FILING_TEMPLATE = SECFiling(
+    company_name="NVIDIA",
+    cik="0001045810",
+    ticker="NVDA",
+    form_type="10-K",
+    filing_date="2024-02-20",
+    accession_number="0001045810-24-000001",
+    primary_document="nvda-20240128.htm",
+    file_url="https://example.com/filing.htm",
+)
+
+# What each template's to_dict() must produce
+_EXPECTED_QUOTE_DICT = {
+    "symbol": "NVDA",
+    "name": "NVIDIA Corporation",
+    "price": 875.50,
+    "change": 12.30,
+    "change_percent": 1.42,
+    "volume": 45000000,
+    "market_cap": 2150000000000,
+    "pe_ratio": 65.5,
+    "forward_pe": 45.2,
+    "dividend_yield": 0.0003,
+    "fifty_two_week_high": 950.00,
+    "fifty_two_week_low": 450.00,
+    "market_state": "REGULAR",
+    "timestamp": "2024-01-01T12:00:00",
+}
+
+_EXPECTED_METRICS_DICT = {
+    "symbol": "NVDA",
+    "revenue": 60000000000,
+    "net_income": 20000000000,
+    "total_assets": 100000000000,
+    "total_debt": 10000000000,
+    "free_cash_flow": 15000000000,
+    "operating_margin": 0.45,
+    "profit_margin": 0.33,
+    "return_on_equity": 0.40,
+    "debt_to_equity": 0.20,
+    "current_ratio": 2.5,
+    "fiscal_year_end": "2024-01-31",
+}
+
+_EXPECTED_SEARCH_RESULT_DICT = {
+    "title": "Test",
+    "url": "https://example.com",
+    "snippet": "Content",
+    "source": "Source",
+    "published": "2024-01-01",
+}
+
+_EXPECTED_NEWS_RESULT_DICT = {
+    "title": "News",
+    "url": "https://news.com",
+    "snippet": "Content",
+    "source": "Source",
+    "date": "2024-01-01",
+    "image": "https://img.com/image.jpg",
+}
+
+_EXPECTED_FILING_DICT = {
+    "company_name": "NVIDIA",
+    "cik": "0001045810",
+    "ticker": "NVDA",
+    "form_type": "10-K",
+    "filing_date": "2024-02-20",
+    "accession_number": "0001045810-24-000001",
+    "primary_document": "nvda-20240128.htm",
+    "file_url": "https://example.com/filing.htm",
+}
+
+# SEC submissions payloads; tests only read them, so they are shared as-is
+_FILINGS_RESPONSE = {
+    "name": "NVIDIA Corporation",
+    "filings": {
+        "recent": {
+            "form": ["10-K", "8-K"],
+            "filingDate": ["2024-02-20", "2024-01-15"],
+            "accessionNumber": ["0001045810-24-000001", "0001045810-24-000002"],
+            "primaryDocument": ["nvda-20240128.htm", "doc.htm"],
+        }
+    },
+}
+
+_NO_10K_FILINGS_RESPONSE = {
+    "name": "Test Corp",
+    "filings": {
+        "recent": {
+            "form": ["8-K", "8-K"],
+            "filingDate": ["2024-01-15", "2024-01-10"],
+            "accessionNumber": ["001", "002"],
+            "primaryDocument": ["doc1.htm", "doc2.htm"],
+        }
+    },
+}
+
+_EMPTY_FILINGS_RESPONSE = {
+    "name": "NVIDIA",
+    "filings": {
+        "recent": {
+            "form": [],
+            "filingDate": [],
+            "accessionNumber": [],
+            "primaryDocument": [],
+        }
+    },
+}
 
 
 class TestStockQuote:
@@ -14,29 +183,9 @@ class TestStockQuote:
 
     def test_to_dict(self):
         """Test StockQuote to_dict conversion."""
-        quote = StockQuote(
-            symbol="NVDA",
-            name="NVIDIA Corporation",
-            price=875.50,
-            change=12.30,
-            change_percent=1.42,
-            volume=45000000,
-            market_cap=2150000000000,
-            pe_ratio=65.5,
-            forward_pe=45.2,
-            dividend_yield=0.0003,
-            fifty_two_week_high=950.00,
-            fifty_two_week_low=450.00,
-            market_state="REGULAR",
-            timestamp=datetime(2024, 1, 1, 12, 0, 0),
-        )
-
-        result = quote.to_dict()
+        quote = copy.copy(_QUOTE_TEMPLATE)
 
-        assert result["symbol"] == "NVDA"
-        assert result["price"] == 875.50
-        assert result["fifty_two_week_high"] == 950.00
-        assert "timestamp" in result
+        assert quote.to_dict() == _EXPECTED_QUOTE_DICT
 
 
 class TestFinancialMetrics:
@@ -44,41 +193,90 @@ class TestFinancialMetrics:
 
     def test_to_dict(self):
         """Test FinancialMetrics to_dict conversion."""
-        metrics = FinancialMetrics(
-            symbol="NVDA",
-            revenue=60000000000,
-            net_income=20000000000,
-            total_assets=100000000000,
-            total_debt=10000000000,
-            free_cash_flow=15000000000,
-            operating_margin=0.45,
-            profit_margin=0.33,
-            return_on_equity=0.40,
-            debt_to_equity=0.20,
-            current_ratio=2.5,
-            fiscal_year_end="2024-01-31",
-        )
+        metrics = copy.copy(_METRICS_TEMPLATE)
+
+        assert metrics.to_dict() == _EXPECTED_METRICS_DICT
+
+
+class FakeAPIError(Exception):
+    """Error raised by a mocked data source."""
+
+
+@pytest.fixture
+def no_retry_wait(monkeypatch):
+    """Drop tenacity's backoff so retried failures don't sleep."""
+    for fn in (
+        YFinanceTool._fetch_quote_with_retry,
+        YFinanceTool.get_financials,
+        DuckDuckGoSearchTool.search,
+        DuckDuckGoSearchTool.search_news,
+    ):
+        monkeypatch.setattr(fn.retry, "wait", wait_none())
+
+
+# Module-level limiters the tools acquire before every call
+_LIMITER_TARGETS = (
+    "src.tools.yfinance_tool.yfinance_limiter",
+    "src.tools.search_tool.search_limiter",
+    "src.tools.sec_edgar_tool.sec_limiter",
+)
+
+
+@pytest.fixture(scope="class")
+def no_rate_limits():
+    """Swap the tools' real-clock rate limiters for unlimited ones."""
+    with pytest.MonkeyPatch.context() as mp:
+        for target in _LIMITER_TARGETS:
+            mp.setattr(target, RateLimiter(requests_per_period=1_000_000, period_seconds=1))
+        yield
+
+
+def _fresh_mock_fixture(target: str, attr: str | None = None, **mock_kwargs: Any):
+    """Build a per-test fixture that swaps a fresh Mock in for a shared dependency.
+
+    Args:
+        target: Name of the class-scoped tool fixture, or a dotted import path
+            to patch when ``attr`` is None
+        attr: Attribute of the tool to replace
+        **mock_kwargs: Passed to Mock (e.g. ``spec`` or ``get.return_value``)
+    """
+
+    @pytest.fixture
+    def fixture(request, monkeypatch):
+        mock = Mock(**mock_kwargs)
+        if attr is None:
+            monkeypatch.setattr(target, mock)
+        else:
+            monkeypatch.setattr(request.getfixturevalue(target), attr, mock)
+        return mock
+
+    return fixture
+
 
-        result = metrics.to_dict()
+@pytest.fixture(scope="class")
+def yf_tool(class_mock_settings, no_rate_limits):
+    """YFinanceTool shared by a test class; its cache is swapped per test."""
+    return YFinanceTool(cache=Mock())
 
-        assert result["symbol"] == "NVDA"
-        assert result["revenue"] == 60000000000
-        assert result["profit_margin"] == 0.33
 
+yf_cache = _fresh_mock_fixture("yf_tool", "_cache", **{"get.return_value": None})
+mock_yf_ticker = _fresh_mock_fixture("src.tools.yfinance_tool.yf.Ticker")
 
+
+@pytest.mark.usefixtures("yf_cache", "mock_yf_ticker")
 class TestYFinanceTool:
     """Tests for YFinance tool."""
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_quote_success(self, mock_cache, mock_ticker, sample_stock_info):
+    def test_uses_mock_settings(self, yf_tool, class_mock_settings):
+        """Test that the shared tool is built against the mock settings."""
+        assert yf_tool._settings is class_mock_settings
+
+    def test_get_quote_success(self, yf_tool, mock_yf_ticker, sample_stock_info):
         """Test successful quote retrieval."""
         # Setup mocks
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = sample_stock_info
+        mock_yf_ticker.return_value.info = sample_stock_info
 
-        tool = YFinanceTool()
-        quote = tool.get_quote("NVDA")
+        quote = yf_tool.get_quote("NVDA")
 
         assert quote is not None
         assert quote.symbol == "NVDA"
@@ -86,198 +284,137 @@ class TestYFinanceTool:
         assert quote.price == 875.50
         assert quote.pe_ratio == 65.5
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_quote_cached(self, mock_cache, mock_ticker):
+    def test_get_quote_cached(self, yf_tool, yf_cache, mock_yf_ticker, cached_quote_data):
         """Test quote retrieval from cache."""
-        cached_data = {
-            "symbol": "NVDA",
-            "name": "NVIDIA Corporation",
-            "price": 875.50,
-            "change": 12.30,
-            "change_percent": 1.42,
-            "volume": 45000000,
-            "market_cap": 2150000000000,
-            "pe_ratio": 65.5,
-            "forward_pe": 45.2,
-            "dividend_yield": 0.0003,
-            "fifty_two_week_high": 950.00,
-            "fifty_two_week_low": 450.00,
-            "market_state": "REGULAR",
-            "timestamp": "2024-01-01T12:00:00",
-        }
-        mock_cache.return_value.get.return_value = cached_data
+        yf_cache.get.return_value = cached_quote_data
 
-        tool = YFinanceTool()
-        quote = tool.get_quote("NVDA")
+        quote = yf_tool.get_quote("NVDA")
 
         assert quote is not None
         assert quote.symbol == "NVDA"
         # Ticker should not be called when cache hit
-        mock_ticker.assert_not_called()
+        mock_yf_ticker.assert_not_called()
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_quote_no_data(self, mock_cache, mock_ticker):
+    def test_get_quote_no_data(self, yf_tool, mock_yf_ticker):
         """Test handling of missing data."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = {}
+        mock_yf_ticker.return_value.info = {}
 
-        tool = YFinanceTool()
-        quote = tool.get_quote("INVALID")
+        quote = yf_tool.get_quote("INVALID")
 
         assert quote is None
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_quote_exception(self, mock_cache, mock_ticker):
+    @pytest.mark.usefixtures("no_retry_wait")
+    def test_get_quote_exception(self, yf_tool, mock_yf_ticker):
         """Test quote fetch with exception."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = None
-        mock_ticker.side_effect = Exception("API Error")
-
-        tool = YFinanceTool()
-
-        with pytest.raises(Exception):  # noqa: B017
-            tool.get_quote("NVDA")
-
-    def test_safe_float_with_nan(self):
-        """Test NaN handling."""
-        with patch("src.tools.yfinance_tool.get_cache"):
-            tool = YFinanceTool()
-
-        assert tool._safe_float(None) is None
-        assert tool._safe_float(float("nan")) is None
-        assert tool._safe_float(123.45) == 123.45
-        assert tool._safe_float("invalid") is None
-
-    def test_safe_int(self):
+        mock_yf_ticker.side_effect = FakeAPIError("API Error")
+
+        with pytest.raises(RetryError) as exc_info:
+            yf_tool.get_quote("NVDA")
+
+        assert isinstance(exc_info.value.last_attempt.exception(), FakeAPIError)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, None), (float("nan"), None), (123.45, 123.45), ("invalid", None)],
+    )
+    def test_safe_float(self, yf_tool, value, expected):
+        """Test safe float conversion, including NaN handling."""
+        assert yf_tool._safe_float(value) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(None, 0), (123, 123), ("invalid", 0), (123.7, 123)],
+    )
+    def test_safe_int(self, yf_tool, value, expected):
         """Test safe int conversion."""
-        with patch("src.tools.yfinance_tool.get_cache"):
-            tool = YFinanceTool()
-
-        assert tool._safe_int(None) == 0
-        assert tool._safe_int(123) == 123
-        assert tool._safe_int("invalid") == 0
-        assert tool._safe_int(123.7) == 123
+        assert yf_tool._safe_int(value) == expected
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_financials_success(self, mock_cache, mock_ticker, sample_stock_info):
+    def test_get_financials_success(self, yf_tool, mock_yf_ticker, sample_stock_info):
         """Test successful financials retrieval."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = sample_stock_info
+        mock_yf_ticker.return_value.info = sample_stock_info
 
-        tool = YFinanceTool()
-        metrics = tool.get_financials("NVDA")
+        metrics = yf_tool.get_financials("NVDA")
 
         assert metrics is not None
         assert metrics.symbol == "NVDA"
         assert metrics.revenue == 60000000000
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_financials_cached(self, mock_cache, mock_ticker):
+    def test_get_financials_cached(self, yf_tool, yf_cache, mock_yf_ticker, cached_financials_data):
         """Test financials retrieval from cache."""
-        cached_data = {
-            "symbol": "NVDA",
-            "revenue": 60000000000,
-            "net_income": 20000000000,
-            "total_assets": None,
-            "total_debt": None,
-            "free_cash_flow": None,
-            "operating_margin": None,
-            "profit_margin": 0.33,
-            "return_on_equity": None,
-            "debt_to_equity": None,
-            "current_ratio": None,
-            "fiscal_year_end": None,
-        }
-        mock_cache.return_value.get.return_value = cached_data
+        yf_cache.get.return_value = cached_financials_data
 
-        tool = YFinanceTool()
-        metrics = tool.get_financials("NVDA")
+        metrics = yf_tool.get_financials("NVDA")
 
         assert metrics is not None
         assert metrics.symbol == "NVDA"
-        mock_ticker.assert_not_called()
+        mock_yf_ticker.assert_not_called()
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_financials_no_data(self, mock_cache, mock_ticker):
+    def test_get_financials_no_data(self, yf_tool, mock_yf_ticker):
         """Test financials with no data."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = None
+        mock_yf_ticker.return_value.info = None
 
-        tool = YFinanceTool()
-        metrics = tool.get_financials("INVALID")
+        metrics = yf_tool.get_financials("INVALID")
 
         assert metrics is None
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_get_financials_exception(self, mock_cache, mock_ticker):
+    @pytest.mark.usefixtures("no_retry_wait")
+    def test_get_financials_exception(self, yf_tool, mock_yf_ticker):
         """Test financials fetch with exception."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.side_effect = Exception("API Error")
+        mock_yf_ticker.side_effect = FakeAPIError("API Error")
 
-        tool = YFinanceTool()
+        with pytest.raises(RetryError) as exc_info:
+            yf_tool.get_financials("NVDA")
 
-        with pytest.raises(Exception):  # noqa: B017
-            tool.get_financials("NVDA")
+        assert isinstance(exc_info.value.last_attempt.exception(), FakeAPIError)
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_compare_pe_ratios(self, mock_cache, mock_ticker, sample_stock_info):
+    def test_compare_pe_ratios(self, yf_tool, mock_yf_ticker, sample_stock_info):
         """Test P/E ratio comparison."""
-        mock_cache.return_value.get.return_value = None
-
         # Different P/E for each ticker
-        def get_info(ticker):
-            info = sample_stock_info.copy()
-            if ticker == "AMD":
-                info["symbol"] = "AMD"
-                info["trailingPE"] = 45.0
-            return MagicMock(info=info)
-
-        mock_ticker.side_effect = get_info
+        tickers = {
+            "NVDA": SimpleNamespace(info=sample_stock_info),
+            "AMD": SimpleNamespace(info={**sample_stock_info, "symbol": "AMD", "trailingPE": 45.0}),
+        }
+        mock_yf_ticker.side_effect = tickers.__getitem__
 
-        tool = YFinanceTool()
-        comparison = tool.compare_pe_ratios(["NVDA", "AMD"])
+        comparison = yf_tool.compare_pe_ratios(["NVDA", "AMD"])
 
-        assert "NVDA" in comparison
-        assert "AMD" in comparison
+        assert comparison == {"NVDA": 65.5, "AMD": 45.0}
 
-    @patch("src.tools.yfinance_tool.yf.Ticker")
-    @patch("src.tools.yfinance_tool.get_cache")
-    def test_compare_pe_ratios_with_missing(self, mock_cache, mock_ticker):
+    def test_compare_pe_ratios_with_missing(self, yf_tool, mock_yf_ticker):
         """Test P/E comparison with missing data."""
-        mock_cache.return_value.get.return_value = None
-        mock_ticker.return_value.info = {}
+        mock_yf_ticker.return_value.info = {}
 
-        tool = YFinanceTool()
-        comparison = tool.compare_pe_ratios(["INVALID"])
+        comparison = yf_tool.compare_pe_ratios(["INVALID"])
 
         assert comparison["INVALID"] is None
 
+    def test_get_quotes_reports_failures_per_symbol(
+        self, yf_tool, mock_yf_ticker, sample_stock_info, no_retry_wait
+    ):
+        """Test that one failing symbol doesn't fail the whole batch."""
+        tickers = {"NVDA": SimpleNamespace(info=sample_stock_info)}
+
+        def ticker(symbol):
+            if symbol not in tickers:
+                raise FakeAPIError("API Error")
+            return tickers[symbol]
+
+        mock_yf_ticker.side_effect = ticker
+
+        quotes = yf_tool.get_quotes(["NVDA", "BAD"])
+
+        assert quotes["NVDA"].pe_ratio == 65.5
+        assert isinstance(quotes["BAD"], RetryError)
+
 
 class TestSearchResult:
     """Tests for SearchResult dataclass."""
 
     def test_to_dict(self):
         """Test SearchResult to_dict conversion."""
-        result = SearchResult(
-            title="Test",
-            url="https://example.com",
-            snippet="Content",
-            source="Source",
-            published="2024-01-01",
-        )
+        result = copy.copy(_SEARCH_RESULT_TEMPLATE)
 
-        d = result.to_dict()
-
-        assert d["title"] == "Test"
-        assert d["url"] == "https://example.com"
+        assert result.to_dict() == _EXPECTED_SEARCH_RESULT_DICT
 
 
 class TestNewsResult:
@@ -285,77 +422,59 @@ class TestNewsResult:
 
     def test_to_dict(self):
         """Test NewsResult to_dict conversion."""
-        result = NewsResult(
-            title="News",
-            url="https://news.com",
-            snippet="Content",
-            source="Source",
-            date="2024-01-01",
-            image="https://img.com/image.jpg",
-        )
+        result = copy.copy(_NEWS_RESULT_TEMPLATE)
 
-        d = result.to_dict()
+        assert result.to_dict() == _EXPECTED_NEWS_RESULT_DICT
 
-        assert d["title"] == "News"
-        assert d["image"] == "https://img.com/image.jpg"
 
+@pytest.fixture(scope="class")
+def search_tool(no_rate_limits):
+    """DuckDuckGoSearchTool shared by a test class, with mock cache and client."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.tools.search_tool.DDGS", Mock())
+        return DuckDuckGoSearchTool(cache=Mock())
 
+
+search_cache = _fresh_mock_fixture("search_tool", "_cache", **{"get.return_value": None})
+mock_ddgs = _fresh_mock_fixture("search_tool", "_ddgs")
+
+
+@pytest.mark.usefixtures("search_cache", "mock_ddgs")
 class TestDuckDuckGoSearchTool:
     """Tests for DuckDuckGo search tool."""
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_success(self, mock_cache, mock_ddgs, sample_search_results):
+    def test_search_success(self, search_tool, mock_ddgs, sample_search_results):
         """Test successful search."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.text.return_value = sample_search_results
+        mock_ddgs.text.return_value = sample_search_results
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search("NVIDIA stock news")
+        results = search_tool.search("NVIDIA stock news")
 
         assert len(results) == 2
         assert results[0].title == "NVIDIA Stock Surges on AI Demand"
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_cached(self, mock_cache, mock_ddgs):
+    def test_search_cached(self, search_tool, search_cache, mock_ddgs, cached_search_data):
         """Test search retrieval from cache."""
-        cached_data = [
-            {
-                "title": "Cached Result",
-                "url": "https://example.com",
-                "snippet": "Cached content",
-                "source": "Cache",
-                "published": None,
-            }
-        ]
-        mock_cache.return_value.get.return_value = cached_data
+        search_cache.get.return_value = cached_search_data
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search("test query")
+        results = search_tool.search("test query")
 
         assert len(results) == 1
         assert results[0].title == "Cached Result"
-        mock_ddgs.return_value.text.assert_not_called()
+        mock_ddgs.text.assert_not_called()
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_exception(self, mock_cache, mock_ddgs):
+    @pytest.mark.usefixtures("no_retry_wait")
+    def test_search_exception(self, search_tool, mock_ddgs):
         """Test search with exception."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.text.side_effect = Exception("Search Error")
+        mock_ddgs.text.side_effect = FakeAPIError("Search Error")
 
-        tool = DuckDuckGoSearchTool()
+        with pytest.raises(RetryError) as exc_info:
+            search_tool.search("test query")
 
-        with pytest.raises(Exception):  # noqa: B017
-            tool.search("test query")
+        assert isinstance(exc_info.value.last_attempt.exception(), FakeAPIError)
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_news(self, mock_cache, mock_ddgs):
+    def test_search_news(self, search_tool, mock_ddgs):
         """Test news search."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.news.return_value = [
+        mock_ddgs.news.return_value = [
             {
                 "title": "Breaking News",
                 "url": "https://news.com/article",
@@ -366,387 +485,208 @@ class TestDuckDuckGoSearchTool:
             }
         ]
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_news("NVIDIA")
+        results = search_tool.search_news("NVIDIA")
 
         assert len(results) == 1
         assert results[0].title == "Breaking News"
         assert results[0].source == "NewsSource"
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_news_cached(self, mock_cache, mock_ddgs):
+    def test_search_news_cached(self, search_tool, search_cache, mock_ddgs, cached_news_data):
         """Test news search from cache."""
-        cached_data = [
-            {
-                "title": "Cached News",
-                "url": "https://news.com",
-                "snippet": "Content",
-                "source": "Source",
-                "date": "2024-01-01",
-                "image": None,
-            }
-        ]
-        mock_cache.return_value.get.return_value = cached_data
+        search_cache.get.return_value = cached_news_data
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_news("test")
+        results = search_tool.search_news("test")
 
         assert len(results) == 1
-        mock_ddgs.return_value.news.assert_not_called()
+        mock_ddgs.news.assert_not_called()
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_news_exception(self, mock_cache, mock_ddgs):
+    @pytest.mark.usefixtures("no_retry_wait")
+    def test_search_news_exception(self, search_tool, mock_ddgs):
         """Test news search with exception."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.news.side_effect = Exception("News Error")
+        mock_ddgs.news.side_effect = FakeAPIError("News Error")
 
-        tool = DuckDuckGoSearchTool()
+        with pytest.raises(RetryError) as exc_info:
+            search_tool.search_news("test")
 
-        with pytest.raises(Exception):  # noqa: B017
-            tool.search_news("test")
+        assert isinstance(exc_info.value.last_attempt.exception(), FakeAPIError)
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_stock_news(self, mock_cache, mock_ddgs):
+    def test_search_stock_news(self, search_tool, mock_ddgs):
         """Test stock news search."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.news.return_value = []
+        mock_ddgs.news.return_value = []
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_stock_news("NVDA", "NVIDIA Corporation")
+        results = search_tool.search_stock_news("NVDA", "NVIDIA Corporation")
 
         assert results == []
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_stock_news_no_company_name(self, mock_cache, mock_ddgs):
+    def test_search_stock_news_no_company_name(self, search_tool, mock_ddgs):
         """Test stock news search without company name."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.news.return_value = []
+        mock_ddgs.news.return_value = []
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_stock_news("NVDA")
+        results = search_tool.search_stock_news("NVDA")
 
         assert results == []
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_financial_topic(self, mock_cache, mock_ddgs):
+    def test_search_financial_topic(self, search_tool, mock_ddgs):
         """Test financial topic search."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.text.return_value = []
+        mock_ddgs.text.return_value = []
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_financial_topic("China supply chain", "NVIDIA")
+        results = search_tool.search_financial_topic("China supply chain", "NVIDIA")
 
         assert results == []
 
-    @patch("src.tools.search_tool.DDGS")
-    @patch("src.tools.search_tool.get_cache")
-    def test_search_financial_topic_no_company(self, mock_cache, mock_ddgs):
+    def test_search_financial_topic_no_company(self, search_tool, mock_ddgs):
         """Test financial topic search without company."""
-        mock_cache.return_value.get.return_value = None
-        mock_ddgs.return_value.text.return_value = []
+        mock_ddgs.text.return_value = []
 
-        tool = DuckDuckGoSearchTool()
-        results = tool.search_financial_topic("China supply chain")
+        results = search_tool.search_financial_topic("China supply chain")
 
         assert results == []
 
 
+@pytest.fixture(scope="class")
+def sec_tool(class_mock_settings, no_rate_limits):
+    """SECEdgarTool shared by a test class, built without a real HTTP client."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.tools.sec_edgar_tool.httpx.Client", Mock())
+        return SECEdgarTool()
+
+
+mock_httpx_client = _fresh_mock_fixture("sec_tool", "_client", spec=httpx.Client)
+
+
+@pytest.mark.usefixtures("mock_httpx_client")
 class TestSECEdgarTool:
     """Tests for SEC EDGAR tool."""
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_init(self, mock_client_class):
+    def test_init(self, sec_tool, class_mock_settings):
         """Test tool initialization."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        tool = SECEdgarTool()
-        assert tool._client is not None
+        assert sec_tool._client is not None
+        assert sec_tool._settings is class_mock_settings
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_cik_known(self, mock_client_class):
+    def test_get_cik_known(self, sec_tool):
         """Test CIK lookup for known ticker."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        tool = SECEdgarTool()
-        cik = tool._get_cik("NVDA")
+        cik = sec_tool._get_cik("NVDA")
 
         assert cik == "0001045810"
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_cik_search_success(self, mock_client_class):
+    def test_get_cik_search_success(self, sec_tool, mock_httpx_client):
         """Test CIK lookup via SEC search."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "CIK=0001234567&action"
-        mock_client.get.return_value = mock_response
+        mock_response = SimpleNamespace(status_code=200, text="CIK=0001234567&action")
+        mock_httpx_client.get.return_value = mock_response
 
-        tool = SECEdgarTool()
-        cik = tool._get_cik("UNKNOWN")
+        cik = sec_tool._get_cik("UNKNOWN")
 
         assert cik == "0001234567"
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_cik_search_not_found(self, mock_client_class):
+    def test_get_cik_search_not_found(self, sec_tool, mock_httpx_client):
         """Test CIK lookup when not found."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "No CIK found"
-        mock_client.get.return_value = mock_response
+        mock_response = SimpleNamespace(status_code=200, text="No CIK found")
+        mock_httpx_client.get.return_value = mock_response
 
-        tool = SECEdgarTool()
-        cik = tool._get_cik("INVALID")
+        cik = sec_tool._get_cik("INVALID")
 
         assert cik is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_cik_exception(self, mock_client_class):
+    def test_get_cik_exception(self, sec_tool, mock_httpx_client):
         """Test CIK lookup with exception."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
+        mock_httpx_client.get.side_effect = Exception("Network error")
 
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_client.get.side_effect = Exception("Network error")
-
-        tool = SECEdgarTool()
-        cik = tool._get_cik("INVALID")
+        cik = sec_tool._get_cik("INVALID")
 
         assert cik is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_company_filings_success(self, mock_client_class):
+    def test_get_company_filings_success(self, sec_tool, mock_httpx_client):
         """Test getting company filings."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"filings": {"recent": {"form": ["10-K"]}}}
-        mock_client.get.return_value = mock_response
+        mock_httpx_client.get.return_value = Mock(
+            status_code=200, json=Mock(return_value=_FILINGS_RESPONSE)
+        )
 
-        tool = SECEdgarTool()
-        filings = tool.get_company_filings("NVDA")
+        filings = sec_tool.get_company_filings("NVDA")
 
         assert filings is not None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_company_filings_not_found(self, mock_client_class):
+    def test_get_company_filings_not_found(self, sec_tool, mock_httpx_client):
         """Test getting company filings when not found."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get.return_value = mock_response
+        mock_response = SimpleNamespace(status_code=404)
+        mock_httpx_client.get.return_value = mock_response
 
-        tool = SECEdgarTool()
-        filings = tool.get_company_filings("NVDA")
+        filings = sec_tool.get_company_filings("NVDA")
 
         assert filings is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_company_filings_no_cik(self, mock_client_class):
+    def test_get_company_filings_no_cik(self, sec_tool, mock_httpx_client):
         """Test getting filings with unknown CIK."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "No CIK"
-        mock_client.get.return_value = mock_response
+        mock_response = SimpleNamespace(status_code=200, text="No CIK")
+        mock_httpx_client.get.return_value = mock_response
 
-        tool = SECEdgarTool()
-        filings = tool.get_company_filings("UNKNOWN")
+        filings = sec_tool.get_company_filings("UNKNOWN")
 
         assert filings is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_latest_10k_success(self, mock_client_class):
+    def test_get_latest_10k_success(self, sec_tool, mock_httpx_client):
         """Test getting latest 10-K."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "name": "NVIDIA Corporation",
-            "filings": {
-                "recent": {
-                    "form": ["10-K", "8-K"],
-                    "filingDate": ["2024-02-20", "2024-01-15"],
-                    "accessionNumber": ["0001045810-24-000001", "0001045810-24-000002"],
-                    "primaryDocument": ["nvda-20240128.htm", "doc.htm"],
-                }
-            },
-        }
-        mock_client.get.return_value = mock_response
+        mock_httpx_client.get.return_value = Mock(
+            status_code=200, json=Mock(return_value=_FILINGS_RESPONSE)
+        )
 
-        tool = SECEdgarTool()
-        filing = tool.get_latest_10k("NVDA")
+        filing = sec_tool.get_latest_10k("NVDA")
 
         assert filing is not None
         assert filing.form_type == "10-K"
         assert filing.company_name == "NVIDIA Corporation"
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_get_latest_10k_no_10k_found(self, mock_client_class):
+    def test_get_latest_10k_no_10k_found(self, sec_tool, mock_httpx_client):
         """Test getting latest 10-K when none exists."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "name": "Test Corp",
-            "filings": {
-                "recent": {
-                    "form": ["8-K", "8-K"],
-                    "filingDate": ["2024-01-15", "2024-01-10"],
-                    "accessionNumber": ["001", "002"],
-                    "primaryDocument": ["doc1.htm", "doc2.htm"],
-                }
-            },
-        }
-        mock_client.get.return_value = mock_response
+        mock_httpx_client.get.return_value = Mock(
+            status_code=200, json=Mock(return_value=_NO_10K_FILINGS_RESPONSE)
+        )
 
-        tool = SECEdgarTool()
-        filing = tool.get_latest_10k("TEST")
+        filing = sec_tool.get_latest_10k("TEST")
 
         assert filing is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_download_filing_success(self, mock_client_class):
+    def test_download_filing_success(self, sec_tool, mock_httpx_client, tmp_path):
         """Test downloading a filing."""
-        import tempfile
-
-        from src.tools.sec_edgar_tool import SECEdgarTool, SECFiling
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = b"<html>Filing content</html>"
-        mock_client.get.return_value = mock_response
-
-        tool = SECEdgarTool()
-        filing = SECFiling(
-            company_name="NVIDIA",
-            cik="0001045810",
-            ticker="NVDA",
-            form_type="10-K",
-            filing_date="2024-02-20",
-            accession_number="0001045810-24-000001",
-            primary_document="nvda-20240128.htm",
-            file_url="https://example.com/filing.htm",
-        )
+        mock_response = SimpleNamespace(status_code=200, content=b"<html>Filing content</html>")
+        mock_httpx_client.get.return_value = mock_response
+
+        filing = copy.copy(_FILING_TEMPLATE)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = tool.download_filing(filing, tmpdir)
-            assert path is not None
-            assert path.exists()
+        path = sec_tool.download_filing(filing, str(tmp_path))
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_download_filing_failed(self, mock_client_class):
+        assert path is not None
+        assert path.exists()
+        assert path.parent == tmp_path
+
+    def test_download_filing_failed(self, sec_tool, mock_httpx_client):
         """Test downloading a filing when it fails."""
-        from src.tools.sec_edgar_tool import SECEdgarTool, SECFiling
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_client.get.return_value = mock_response
-
-        tool = SECEdgarTool()
-        filing = SECFiling(
-            company_name="NVIDIA",
-            cik="0001045810",
-            ticker="NVDA",
-            form_type="10-K",
-            filing_date="2024-02-20",
-            accession_number="0001045810-24-000001",
-            primary_document="nvda-20240128.htm",
-            file_url="https://example.com/filing.htm",
-        )
+        mock_response = SimpleNamespace(status_code=404)
+        mock_httpx_client.get.return_value = mock_response
 
-        path = tool.download_filing(filing)
+        filing = copy.copy(_FILING_TEMPLATE)
+
+        path = sec_tool.download_filing(filing)
         assert path is None
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_download_latest_10k(self, mock_client_class):
+    def test_download_latest_10k(self, sec_tool, mock_httpx_client):
         """Test download_latest_10k convenience method."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
         # First call for filings lookup
-        mock_response1 = MagicMock()
-        mock_response1.status_code = 200
-        mock_response1.json.return_value = {
-            "name": "NVIDIA",
-            "filings": {
-                "recent": {
-                    "form": [],
-                    "filingDate": [],
-                    "accessionNumber": [],
-                    "primaryDocument": [],
-                }
-            },
-        }
-
-        mock_client.get.return_value = mock_response1
+        mock_httpx_client.get.return_value = Mock(
+            status_code=200, json=Mock(return_value=_EMPTY_FILINGS_RESPONSE)
+        )
 
-        tool = SECEdgarTool()
-        result = tool.download_latest_10k("NVDA")
+        result = sec_tool.download_latest_10k("NVDA")
 
         assert result is None  # No 10-K found
 
-    @patch("src.tools.sec_edgar_tool.httpx.Client")
-    def test_close(self, mock_client_class):
+    def test_close(self, sec_tool, mock_httpx_client):
         """Test closing the HTTP client."""
-        from src.tools.sec_edgar_tool import SECEdgarTool
-
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-
-        tool = SECEdgarTool()
-        tool.close()
+        sec_tool.close()
 
-        mock_client.close.assert_called_once()
+        mock_httpx_client.close.assert_called_once()
 
     def test_sec_filing_to_dict(self):
         """Test SECFiling to_dict method."""
-        from src.tools.sec_edgar_tool import SECFiling
-
-        filing = SECFiling(
-            company_name="NVIDIA",
-            cik="0001045810",
-            ticker="NVDA",
-            form_type="10-K",
-            filing_date="2024-02-20",
-            accession_number="001",
-            primary_document="doc.htm",
-            file_url="https://example.com",
-        )
-
-        d = filing.to_dict()
+        filing = copy.copy(_FILING_TEMPLATE)
 
-        assert d["company_name"] == "NVIDIA"
-        assert d["ticker"] == "NVDA"
+        assert filing.to_dict() == _EXPECTED_FILING_DICT